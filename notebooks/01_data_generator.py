@@ -19,7 +19,8 @@
 # MAGIC 
 # MAGIC ## 前提条件
 # MAGIC - Volume `raw` が作成済み
-# MAGIC - クラスターに numpy, pandas がインストール済み
+# MAGIC - クラスターに numpy, pandas, pyarrow がインストール済み
+# MAGIC - numba があれば物理シミュレーションをJITコンパイル（なければ純Pythonで実行）
 
 # COMMAND ----------
 
@@ -34,12 +35,14 @@ dbutils.widgets.text("schema", "yao_demo_vehicle_app", "Schema Name")
 dbutils.widgets.text("vehicle_id", "VH001", "Vehicle ID")
 dbutils.widgets.text("duration_seconds", "600", "Duration (seconds)")
 dbutils.widgets.text("scenario", "realistic", "Scenario Type")
+dbutils.widgets.text("seed", "", "Random Seed (empty = random)")
 
 CATALOG = dbutils.widgets.get("catalog")
 SCHEMA = dbutils.widgets.get("schema")
 VEHICLE_ID = dbutils.widgets.get("vehicle_id")
 DURATION_SECONDS = int(dbutils.widgets.get("duration_seconds"))
 SCENARIO_TYPE = dbutils.widgets.get("scenario")
+SEED = int(dbutils.widgets.get("seed")) if dbutils.widgets.get("seed").strip() else None
 
 print(f"Configuration:")
 print(f"  Catalog: {CATALOG}")
@@ -47,6 +50,7 @@ print(f"  Schema: {SCHEMA}")
 print(f"  Vehicle ID: {VEHICLE_ID}")
 print(f"  Duration: {DURATION_SECONDS}s")
 print(f"  Scenario: {SCENARIO_TYPE}")
+print(f"  Seed: {SEED}")
 
 # COMMAND ----------
 
@@ -69,13 +73,20 @@ CAN_MESSAGES = {
 
 # COMMAND ----------
 
+import os
 import numpy as np
 import pandas as pd
-import struct
-from datetime import datetime, timedelta
+import pyarrow as pa
+import pyarrow.parquet as pq
+from datetime import datetime
 from dataclasses import dataclass
 from typing import List, Tuple
-import random
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; run the physics loop as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 # COMMAND ----------
 
@@ -113,11 +124,26 @@ class RealisticDrivingScenario:
     - 発進、市街地、高速、緊急ブレーキ、駐車
     """
     
-    def __init__(self, duration_seconds: int = 600):
+    def __init__(self, duration_seconds: int = 600, seed: int | None = None):
         self.duration = duration_seconds
+        self.rng = np.random.default_rng(seed)  # Same seed -> same drive
         self.state = VehicleState()
-        self.events: List[dict] = []
+        # Fired events as parallel columns (see `events`)
+        self._ev_ts: List[np.datetime64] = []
+        self._ev_type: List[str] = []
+        self._ev_desc: List[str] = []
+        self._ev_speed: List[float] = []
         self.phases = self._create_phases()
+    
+    @property
+    def events(self) -> pd.DataFrame:
+        """Fired events as a typed DataFrame (event types are a small closed set)"""
+        return pd.DataFrame({
+            "timestamp": np.array(self._ev_ts, dtype="datetime64[ms]"),
+            "type": pd.Categorical(self._ev_type),
+            "description": self._ev_desc,
+            "speed_kmh": np.asarray(self._ev_speed, dtype=np.float32),
+        })
         
     def _create_phases(self) -> List[DrivingPhase]:
         """Define the driving phases for a 10-minute realistic scenario"""
@@ -238,146 +264,196 @@ class RealisticDrivingScenario:
         ]
         return phases
     
-    def _get_current_phase(self, time_sec: float) -> DrivingPhase:
-        """Get the current driving phase based on time"""
-        for phase in self.phases:
-            if phase.start_sec <= time_sec < phase.end_sec:
-                return phase
-        return self.phases[-1]
-    
-    def _apply_event(self, event: dict, timestamp: datetime):
-        """Apply an event to the vehicle state"""
+    @staticmethod
+    def _event_overrides(event: dict) -> Tuple[float, float, float, float]:
+        """
+        Map an event to the state values it forces.
+        
+        Returns (throttle_pct, brake_pressure, brake_active, steering_angle);
+        NaN means the event leaves that value untouched.
+        """
         event_type = event["type"]
+        keep = np.nan
         
         if event_type in ["emergency_brake", "pedestrian_stop"]:
-            self.state.brake_pressure = event.get("brake", 100)
-            self.state.brake_active = True
-            self.state.throttle_pct = 0
+            return 0.0, event.get("brake", 100), 1.0, keep
         elif event_type == "traffic_stop":
-            self.state.brake_pressure = 50
-            self.state.brake_active = True
-            self.state.throttle_pct = 0
+            return 0.0, 50.0, 1.0, keep
         elif event_type == "hard_acceleration":
-            self.state.throttle_pct = event.get("throttle", 90)
-            self.state.brake_pressure = 0
-            self.state.brake_active = False
+            return event.get("throttle", 90), 0.0, 0.0, keep
         elif event_type in ["right_turn", "left_turn", "lane_change_right", "lane_change_left", 
                            "exit_curve", "evasive_steering", "parking_maneuver",
                            "slight_curve_right", "slight_curve_left"]:
-            self.state.steering_angle = event.get("steering", 0)
+            return keep, keep, keep, event.get("steering", 0)
         elif event_type == "deceleration":
-            self.state.throttle_pct = 10
-            self.state.brake_pressure = 20
-            self.state.brake_active = True
+            return 10.0, 20.0, 1.0, keep
         elif event_type == "full_stop":
-            self.state.brake_pressure = 30
-            self.state.brake_active = True
-            self.state.throttle_pct = 0
-        
-        # Record event
-        self.events.append({
-            "timestamp": timestamp,
-            "type": event_type,
-            "description": event.get("description", event_type),
-            "speed_kmh": self.state.speed_kmh
-        })
+            return 0.0, 30.0, 1.0, keep
+        return keep, keep, keep, keep
     
-    def generate_timeline(self, start_time: datetime) -> List[dict]:
+    def generate_timeline(self, start_time: datetime) -> pd.DataFrame:
         """Generate vehicle state timeline at 10ms resolution"""
-        timeline = []
         dt_ms = 10  # 10ms resolution
+        n_ticks = self.duration * 1000 // dt_ms
         scale = self.duration / 600.0
+        rng = self.rng
+        
+        t_ms = np.arange(n_ticks, dtype=np.int64) * dt_ms
         
-        # Build event schedule
+        # Target speed per tick from the phase boundaries
+        phase_starts = np.array([p.start_sec for p in self.phases])
+        target_speeds = np.array([p.target_speed for p in self.phases], dtype=np.float64)
+        # One searchsorted for all ticks; 9 phases fit an int8 index
+        phase_idx = np.searchsorted(phase_starts, t_ms / 1000.0, side="right") - 1
+        phase_idx = np.clip(phase_idx, 0, len(self.phases) - 1).astype(np.int8)
+        target_speed = target_speeds[phase_idx]
+        
+        # Build event schedule (event times snapped to the 10ms tick grid)
         event_schedule = {}
         for phase in self.phases:
             for event in phase.events:
-                event_time_ms = int((phase.start_sec + event["time_offset"] * scale) * 1000)
-                event_schedule[event_time_ms] = event
+                tick = int(round((phase.start_sec + event["time_offset"] * scale) * 1000 / dt_ms))
+                if tick < n_ticks:
+                    event_schedule[tick] = event
         
-        active_event_duration = 0
-        current_phase = None
+        # Sorted trigger ticks; the physics loop walks them with a single pointer
+        event_ticks = np.array(sorted(event_schedule), dtype=np.int64)
+        schedule_events = [event_schedule[tick] for tick in event_ticks]
+        overrides = np.array([self._event_overrides(e) for e in schedule_events], dtype=np.float64).reshape(-1, 4)
+        event_duration_ms = rng.integers(2000, 4001, size=len(schedule_events))  # Event lasts 2-4 seconds
         
-        for ms in range(0, self.duration * 1000, dt_ms):
-            time_sec = ms / 1000.0
-            timestamp = start_time + timedelta(milliseconds=ms)
-            
-            # Get current phase
-            phase = self._get_current_phase(time_sec)
-            if phase != current_phase:
-                current_phase = phase
-            
-            # Check for events
-            if ms in event_schedule and active_event_duration <= 0:
-                self._apply_event(event_schedule[ms], timestamp)
-                active_event_duration = random.randint(2000, 4000)  # Event lasts 2-4 seconds
-            
-            # Update physics towards target speed
-            self._update_physics(dt_ms / 1000.0, phase.target_speed)
-            
-            # Event recovery
-            if active_event_duration > 0:
-                active_event_duration -= dt_ms
-                if active_event_duration <= 0:
-                    # Gradually return to normal
-                    self.state.brake_pressure = 0
-                    self.state.brake_active = False
-                    self.state.throttle_pct = 30
-            
-            timeline.append({
-                "timestamp": timestamp,
-                "speed_kmh": self.state.speed_kmh,
-                "rpm": self.state.rpm,
-                "throttle_pct": self.state.throttle_pct,
-                "brake_pressure": self.state.brake_pressure,
-                "brake_active": self.state.brake_active,
-                "steering_angle": self.state.steering_angle,
-            })
+        # Pre-draw all noise in bulk instead of per tick
+        noise_throttle = rng.uniform(-5, 5, n_ticks)
+        noise_rpm = rng.uniform(-30, 30, n_ticks)
+        noise_steering = rng.uniform(-3, 3, n_ticks)
         
-        return timeline
+        out = np.empty((6, n_ticks), dtype=np.float32)
+        fired_speed = np.full(len(schedule_events), np.nan)
+        s = self.state
+        final = _simulate_drive(
+            s.speed_kmh, s.rpm, s.throttle_pct, s.brake_pressure, s.brake_active, s.steering_angle,
+            target_speed, event_ticks, overrides, event_duration_ms,
+            noise_throttle, noise_rpm, noise_steering, dt_ms, out, fired_speed,
+        )
+        self.state = VehicleState(*final)
+        
+        # Record events that actually fired (an event is skipped while another is active)
+        fired = np.flatnonzero(~np.isnan(fired_speed))
+        self._ev_ts.extend(np.datetime64(start_time, "ms") + (event_ticks[fired] * dt_ms).astype("timedelta64[ms]"))
+        for idx in fired:
+            event = schedule_events[idx]
+            self._ev_type.append(event["type"])
+            self._ev_desc.append(event.get("description", event["type"]))
+        self._ev_speed.extend(fired_speed[fired])
+        
+        return pd.DataFrame({
+            "t_ms": t_ms,
+            "timestamp": np.datetime64(start_time, "ms") + t_ms.astype("timedelta64[ms]"),
+            "speed_kmh": out[0],
+            "rpm": out[1],
+            "throttle_pct": out[2],
+            "brake_pressure": out[3],
+            "brake_active": out[4] > 0,
+            "steering_angle": out[5],
+        })
+
+
+@njit
+def _simulate_drive(
+    speed, rpm, throttle, brake, brake_active, steering,
+    target_speed, event_ticks, overrides, event_duration_ms,
+    noise_throttle, noise_rpm, noise_steering, dt_ms, out, fired_speed,
+):
+    """
+    Run the physics recurrence over pre-computed per-tick arrays.
     
-    def _update_physics(self, dt: float, target_speed: float):
-        """Physics update with target speed tracking"""
-        speed_diff = target_speed - self.state.speed_kmh
+    Speed depends on the previous tick, so this stays a sequential loop, but it
+    only touches scalars and arrays (no dicts, objects or RNG calls) so numba
+    can compile it to a native loop. fastmath is left off: the NaN checks on
+    `overrides` must survive.
+    Writes speed/rpm/throttle/brake/brake_active/steering rows into `out`, the
+    speed at trigger time into `fired_speed`, and returns the final state.
+    """
+    dt = dt_ms / 1000.0
+    active_event_duration = 0
+    next_event = 0
+    k = 0
+    n_events = event_ticks.shape[0]
+    
+    for i in range(target_speed.shape[0]):
+        # Check for events (event_ticks is sorted, so one comparison per tick)
+        fire = False
+        if next_event < n_events and event_ticks[next_event] == i:
+            k = next_event
+            next_event += 1
+            fire = active_event_duration <= 0
+        if fire:
+            fired_speed[k] = speed
+            if not np.isnan(overrides[k, 0]):
+                throttle = overrides[k, 0]
+            if not np.isnan(overrides[k, 1]):
+                brake = overrides[k, 1]
+            if not np.isnan(overrides[k, 2]):
+                brake_active = overrides[k, 2] > 0
+            if not np.isnan(overrides[k, 3]):
+                steering = overrides[k, 3]
+            active_event_duration = event_duration_ms[k]
+        
+        # Update physics towards target speed
+        speed_diff = target_speed[i] - speed
         
         # Auto throttle/brake to reach target speed (cruise control behavior)
-        if not self.state.brake_active and self.state.throttle_pct < 50:
+        if not brake_active and throttle < 50:
             if speed_diff > 5:
-                self.state.throttle_pct = min(60, 30 + speed_diff)
+                throttle = min(60.0, 30 + speed_diff)
             elif speed_diff < -5:
-                self.state.throttle_pct = max(0, 10)
-                self.state.brake_pressure = min(30, -speed_diff)
-                self.state.brake_active = self.state.brake_pressure > 10
+                throttle = 10.0
+                brake = min(30.0, -speed_diff)
+                brake_active = brake > 10
             else:
-                self.state.throttle_pct = 25 + random.uniform(-5, 5)
+                throttle = 25 + noise_throttle[i]
         
         # Acceleration from throttle
-        if self.state.throttle_pct > 0 and not self.state.brake_active:
-            accel = self.state.throttle_pct * 0.12
-            self.state.speed_kmh = min(140, self.state.speed_kmh + accel * dt)
+        if throttle > 0 and not brake_active:
+            speed = min(140.0, speed + throttle * 0.12 * dt)
         
         # Deceleration from braking
-        if self.state.brake_active:
-            decel = self.state.brake_pressure * 0.4
-            self.state.speed_kmh = max(0, self.state.speed_kmh - decel * dt)
+        if brake_active:
+            speed = max(0.0, speed - brake * 0.4 * dt)
         
         # Natural deceleration
-        if self.state.throttle_pct == 0 and not self.state.brake_active:
-            self.state.speed_kmh = max(0, self.state.speed_kmh - 3 * dt)
+        if throttle == 0 and not brake_active:
+            speed = max(0.0, speed - 3 * dt)
         
         # RPM based on speed and throttle (simulated automatic transmission)
-        gear = min(6, max(1, int(self.state.speed_kmh / 25) + 1))
-        base_rpm = 800 + (self.state.speed_kmh / gear) * 80
-        throttle_rpm = self.state.throttle_pct * 15
-        self.state.rpm = min(6500, max(800, base_rpm + throttle_rpm + random.uniform(-30, 30)))
+        gear = min(6, max(1, int(speed / 25) + 1))
+        base_rpm = 800 + (speed / gear) * 80
+        rpm = min(6500.0, max(800.0, base_rpm + throttle * 15 + noise_rpm[i]))
         
         # Steering naturally returns to center with some road noise
-        self.state.steering_angle *= (1 - 2.0 * dt)
-        self.state.steering_angle += random.uniform(-3, 3)
+        steering = steering * (1 - 2.0 * dt) + noise_steering[i]
         
         # Brake release when not active
-        if not self.state.brake_active:
-            self.state.brake_pressure = max(0, self.state.brake_pressure - 100 * dt)
+        if not brake_active:
+            brake = max(0.0, brake - 100 * dt)
+        
+        # Event recovery
+        if active_event_duration > 0:
+            active_event_duration -= dt_ms
+            if active_event_duration <= 0:
+                # Gradually return to normal
+                brake = 0.0
+                brake_active = False
+                throttle = 30.0
+        
+        out[0, i] = speed
+        out[1, i] = rpm
+        out[2, i] = throttle
+        out[3, i] = brake
+        out[4, i] = 1.0 if brake_active else 0.0
+        out[5, i] = steering
+    
+    return speed, rpm, throttle, brake, brake_active, steering
 
 # COMMAND ----------
 
@@ -386,78 +462,65 @@ class RealisticDrivingScenario:
 
 # COMMAND ----------
 
-def encode_vehicle_speed(speed_kmh: float) -> bytes:
+# Big-endian uint16 layout, built once (the vectorized counterpart of a cached struct.Struct(">H"))
+_UINT16_BE = np.dtype(">u2")
+
+# Reciprocals of the DBC signal scales: encoders multiply instead of divide
+_INV_SPEED_SCALE = 100.0     # 1 / 0.01
+_INV_RPM_SCALE = 4.0         # 1 / 0.25
+_INV_THROTTLE_SCALE = 2.5    # 1 / 0.4
+_INV_BRAKE_SCALE = 2.5       # 1 / 0.4
+_INV_ANGLE_SCALE = 10.0      # 1 / 0.1
+_ANGLE_OFFSET = 1080.0
+
+
+def _put_uint16_be(payloads: np.ndarray, offset: int, raw: np.ndarray) -> None:
+    """Write raw values as big-endian uint16 into payload bytes [offset:offset+2]"""
+    payloads[:, offset:offset + 2] = raw.astype(_UINT16_BE).view(np.uint8).reshape(-1, 2)
+
+
+def encode_vehicle_speed(speed_kmh: np.ndarray) -> np.ndarray:
     """Encode vehicle speed to CAN data (arb_id 0x100)"""
     # speed_kmh: bytes[0:2], scale=0.01
-    speed_raw = int(speed_kmh / 0.01)
-    return struct.pack(">H", speed_raw) + b'\x00' * 6
+    payloads = np.zeros((len(speed_kmh), 8), dtype=np.uint8)
+    _put_uint16_be(payloads, 0, (speed_kmh.astype(np.float64) * _INV_SPEED_SCALE).astype(np.uint16))
+    return payloads
 
 
-def encode_engine_data(rpm: float, throttle_pct: float) -> bytes:
+def encode_engine_data(rpm: np.ndarray, throttle_pct: np.ndarray) -> np.ndarray:
     """Encode engine data to CAN data (arb_id 0x101)"""
     # rpm: bytes[0:2], scale=0.25; throttle: byte[2], scale=0.4
-    rpm_raw = int(rpm / 0.25)
-    throttle_raw = int(throttle_pct / 0.4)
-    return struct.pack(">HB", rpm_raw, throttle_raw) + b'\x00' * 5
+    payloads = np.zeros((len(rpm), 8), dtype=np.uint8)
+    _put_uint16_be(payloads, 0, (rpm.astype(np.float64) * _INV_RPM_SCALE).astype(np.uint16))
+    payloads[:, 2] = (throttle_pct.astype(np.float64) * _INV_THROTTLE_SCALE).astype(np.uint8)
+    return payloads
 
 
-def encode_brake_data(pressure: float, active: bool) -> bytes:
+def encode_brake_data(pressure: np.ndarray, active: np.ndarray) -> np.ndarray:
     """Encode brake data to CAN data (arb_id 0x102)"""
     # pressure: byte[0], scale=0.4; active: byte[1] bit0
-    pressure_raw = int(pressure / 0.4)
-    active_raw = 1 if active else 0
-    return struct.pack(">BB", pressure_raw, active_raw) + b'\x00' * 6
+    payloads = np.zeros((len(pressure), 8), dtype=np.uint8)
+    payloads[:, 0] = (pressure.astype(np.float64) * _INV_BRAKE_SCALE).astype(np.uint8)
+    payloads[:, 1] = active.astype(np.uint8)
+    return payloads
 
 
-def encode_steering_data(angle: float) -> bytes:
+def encode_steering_data(angle: np.ndarray) -> np.ndarray:
     """Encode steering data to CAN data (arb_id 0x103)"""
     # angle: bytes[0:2], scale=0.1, offset=-1080
-    angle_raw = int((angle + 1080) / 0.1)
-    return struct.pack(">H", angle_raw) + b'\x00' * 6
+    payloads = np.zeros((len(angle), 8), dtype=np.uint8)
+    _put_uint16_be(payloads, 0, ((angle.astype(np.float64) + _ANGLE_OFFSET) * _INV_ANGLE_SCALE).astype(np.uint16))
+    return payloads
 
 
-def state_to_can_frames(timestamp: datetime, state: dict) -> List[dict]:
-    """Convert vehicle state to CAN frames"""
-    ts = timestamp.timestamp()
-    frames = []
-    
-    # VehicleSpeed (0x100)
-    frames.append({
-        "ts": ts,
-        "channel": "can0",
-        "arb_id": 0x100,
-        "dlc": 8,
-        "data": encode_vehicle_speed(state["speed_kmh"])
-    })
-    
-    # EngineData (0x101)
-    frames.append({
-        "ts": ts,
-        "channel": "can0",
-        "arb_id": 0x101,
-        "dlc": 8,
-        "data": encode_engine_data(state["rpm"], state["throttle_pct"])
-    })
-    
-    # BrakeData (0x102)
-    frames.append({
-        "ts": ts,
-        "channel": "can0",
-        "arb_id": 0x102,
-        "dlc": 8,
-        "data": encode_brake_data(state["brake_pressure"], state["brake_active"])
-    })
-    
-    # SteeringData (0x103)
-    frames.append({
-        "ts": ts,
-        "channel": "can0",
-        "arb_id": 0x103,
-        "dlc": 8,
-        "data": encode_steering_data(state["steering_angle"])
-    })
-    
-    return frames
+def timeline_to_payloads(timeline: pd.DataFrame) -> dict:
+    """Encode the whole timeline into per-message CAN payloads of shape (N, 8)"""
+    return {
+        0x100: encode_vehicle_speed(timeline["speed_kmh"].to_numpy()),
+        0x101: encode_engine_data(timeline["rpm"].to_numpy(), timeline["throttle_pct"].to_numpy()),
+        0x102: encode_brake_data(timeline["brake_pressure"].to_numpy(), timeline["brake_active"].to_numpy()),
+        0x103: encode_steering_data(timeline["steering_angle"].to_numpy()),
+    }
 
 # COMMAND ----------
 
@@ -469,45 +532,61 @@ def state_to_can_frames(timestamp: datetime, state: dict) -> List[dict]:
 def generate_can_data(
     vehicle_id: str = "VH001",
     duration_seconds: int = 600,
-) -> Tuple[pd.DataFrame, List[dict]]:
+    seed: int | None = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Generate CAN data for a vehicle session with realistic driving scenario"""
     
-    scenario = RealisticDrivingScenario(duration_seconds)
+    scenario = RealisticDrivingScenario(duration_seconds, seed)
     start_time = datetime.now()
     
     # Generate timeline
     timeline = scenario.generate_timeline(start_time)
     
-    # Convert to CAN frames (sample based on message periods)
-    can_frames = []
-    last_sent = {arb_id: 0 for arb_id in CAN_MESSAGES}
+    # Encode all ticks at once, then emit each message directly at its own period
+    payloads = timeline_to_payloads(timeline)
+    # Epoch time on the integer millisecond grid: one int64 add, one float conversion
+    start_epoch_ms = round(start_time.timestamp() * 1000)
+    ts = (start_epoch_ms + timeline["t_ms"].to_numpy()) / 1000.0
     
-    for state in timeline:
-        ts_ms = int((state["timestamp"] - start_time).total_seconds() * 1000)
-        
-        for frame in state_to_can_frames(state["timestamp"], state):
-            arb_id = frame["arb_id"]
-            period_ms = CAN_MESSAGES[arb_id]["period_ms"]
-            
-            if ts_ms - last_sent[arb_id] >= period_ms:
-                can_frames.append(frame)
-                last_sent[arb_id] = ts_ms
+    ts_parts, arb_id_parts, payload_parts = [], [], []
+    for arb_id, arb_payloads in payloads.items():
+        stride = CAN_MESSAGES[arb_id]["period_ms"] // 10  # timeline is sampled every 10ms
+        sent = slice(stride, None, stride)  # first frame goes out one period after start
+        ts_parts.append(ts[sent])
+        arb_id_parts.append(np.full(len(ts_parts[-1]), arb_id, dtype=np.int16))
+        payload_parts.append(arb_payloads[sent])
+    
+    # Interleave messages back into bus order (by time, then arb_id)
+    frame_ts = np.concatenate(ts_parts)
+    order = np.argsort(frame_ts, kind="stable")
+    n_frames = len(order)
+    
+    # All DLCs are 8: keep payloads as one packed (N, 8) buffer behind a FixedSizeBinary(8) column
+    frame_payloads = np.ascontiguousarray(np.concatenate(payload_parts)[order])
+    data = pa.FixedSizeBinaryArray.from_buffers(pa.binary(8), n_frames, [None, pa.py_buffer(frame_payloads)])
     
-    df = pd.DataFrame(can_frames)
+    # Build straight from typed column arrays (no per-message frames to concat),
+    # already in the narrow dtypes CAN_FRAME_SCHEMA writes
+    df = pd.DataFrame({
+        "ts": frame_ts[order],
+        "channel": pd.Categorical.from_codes(np.zeros(n_frames, dtype=np.int8), categories=["can0"]),
+        "arb_id": np.concatenate(arb_id_parts)[order],
+        "dlc": np.full(n_frames, 8, dtype=np.int8),
+        "data": pd.arrays.ArrowExtensionArray(data),
+    })
     return df, scenario.events
 
 # COMMAND ----------
 
 # Generate data
 print(f"Generating {DURATION_SECONDS}s of realistic CAN data...")
-can_df, events = generate_can_data(VEHICLE_ID, DURATION_SECONDS)
+can_df, events = generate_can_data(VEHICLE_ID, DURATION_SECONDS, SEED)
 
 print(f"✅ Generated {len(can_df)} CAN frames")
 print(f"✅ Detected events: {len(events)}")
 print("\n📋 イベントタイムライン:")
-for e in events:
-    desc = e.get('description', e['type'])
-    print(f"  [{e['timestamp'].strftime('%H:%M:%S')}] {desc} (速度: {e['speed_kmh']:.1f} km/h)")
+for e in events.itertuples(index=False):
+    print(f"  [{e.timestamp.strftime('%H:%M:%S')}] {e.description} (速度: {e.speed_kmh:.1f} km/h)")
 
 # COMMAND ----------
 
@@ -529,16 +608,54 @@ print(f"Output path: {output_path}")
 
 # COMMAND ----------
 
-# Convert to Spark DataFrame and save
-spark_df = spark.createDataFrame(can_df)
-spark_df.write.mode("overwrite").parquet(f"{output_path}/can_frames.parquet")
-print(f"✅ CAN frames saved to: {output_path}/can_frames.parquet")
-
-# Save events as well
-if events:
-    events_df = spark.createDataFrame(pd.DataFrame(events))
-    events_df.write.mode("overwrite").parquet(f"{output_path}/events.parquet")
-    print(f"✅ Events saved to: {output_path}/events.parquet")
+# Write Parquet directly from Arrow to the Volume (no Spark/JVM round-trip).
+# Keep the Spark-style directory layout: the DLT pipeline reads */*/can_frames.parquet/
+# Narrow column types: 4 distinct arb_ids fit int16, dlc is always 8, channel is constant
+CAN_FRAME_SCHEMA = pa.schema([
+    ("ts", pa.float64()),
+    ("channel", pa.dictionary(pa.int8(), pa.string())),
+    ("arb_id", pa.int16()),
+    ("dlc", pa.int8()),
+    ("data", pa.binary(8)),
+])
+
+can_frames_dir = f"{output_path}/can_frames.parquet"
+os.makedirs(can_frames_dir, exist_ok=True)
+
+# Stream 8192-row batches so only one batch is held in Arrow form at a time.
+# Each batch is also one row group: ~8k rows keeps a column chunk L2-cache sized for readers.
+BATCH_ROWS = 8192
+ROW_GROUP_ROWS = BATCH_ROWS
+
+# Let Arrow use every driver core when converting the pandas columns
+pa.set_cpu_count(os.cpu_count())
+
+with pq.ParquetWriter(
+    f"{can_frames_dir}/part-00000.parquet",
+    CAN_FRAME_SCHEMA,
+    compression="zstd",
+    compression_level=3,
+    use_dictionary=True,
+    write_batch_size=BATCH_ROWS,
+    data_page_size=256 << 10,
+) as writer:
+    for start in range(0, len(can_df), BATCH_ROWS):
+        batch = pa.RecordBatch.from_pandas(
+            can_df.iloc[start:start + BATCH_ROWS], schema=CAN_FRAME_SCHEMA, preserve_index=False
+        )
+        writer.write_batch(batch, row_group_size=ROW_GROUP_ROWS)
+print(f"✅ CAN frames saved to: {can_frames_dir}")
+
+# Save events as well (a few dozen rows: write directly, no Spark job)
+if len(events):
+    events_dir = f"{output_path}/events.parquet"
+    os.makedirs(events_dir, exist_ok=True)
+    pq.write_table(
+        pa.Table.from_pandas(events, preserve_index=False),
+        f"{events_dir}/part-00000.parquet",
+        compression="zstd",
+    )
+    print(f"✅ Events saved to: {events_dir}")
 
 # COMMAND ----------
 
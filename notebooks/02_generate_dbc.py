@@ -129,8 +129,9 @@ print("""
 output_path = f"/Volumes/{CATALOG}/{SCHEMA}/{VOLUME}/{DBC_FILENAME}"
 print(f"Saving DBC file to: {output_path}")
 
-# Write DBC file
-dbutils.fs.put(output_path, DBC_CONTENT, overwrite=True)
+# Write DBC file (Volumes are POSIX-mounted; no DBFS/Py4J round-trip needed)
+with open(output_path, "w", encoding="utf-8") as f:
+    f.write(DBC_CONTENT)
 print(f"✅ DBC file saved successfully!")
 
 # COMMAND ----------
@@ -143,7 +144,8 @@ print(f"✅ DBC file saved successfully!")
 # Verify file was created
 print("Verifying DBC file...")
 print("-" * 60)
-content = dbutils.fs.head(output_path, 1000)
+with open(output_path, encoding="utf-8") as f:
+    content = f.read(1000)
 print(content)
 
 # COMMAND ----------
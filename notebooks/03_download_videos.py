@@ -64,54 +64,159 @@ FALLBACK_VIDEO_URL = "https://www.w3schools.com/html/mov_bbb.mp4"
 
 # COMMAND ----------
 
+import urllib.error
 import urllib.request
 import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
-downloaded_files = []
 
-for camera in CAMERAS:
+def _with_retry(action, label: str, attempts: int = 4, base: float = 2.0):
+    """Run action(), retrying transient network errors with exponential backoff"""
+    for attempt in range(attempts):
+        try:
+            return action()
+        except OSError as e:  # URLError/HTTPError, timeouts, connection resets
+            if attempt == attempts - 1:
+                raise
+            delay = base * 2 ** attempt
+            print(f"   ↻ {label}: {e}, retrying in {delay:.0f}s...")
+            time.sleep(delay)
+
+
+def _download_with_retry(url: str, dest: str, attempts: int = 4, base: float = 2.0) -> None:
+    """Stream url into dest, retrying transient network errors with exponential backoff"""
+    def download():
+        with urllib.request.urlopen(url, timeout=30) as response, open(dest, "wb") as f:
+            shutil.copyfileobj(response, f, length=1 << 20)
+            expected = response.headers.get("Content-Length")
+            if expected is not None and f.tell() < int(expected):
+                raise urllib.error.ContentTooShortError(
+                    f"retrieval incomplete: got {f.tell()} of {expected} bytes", None
+                )
+    
+    _with_retry(download, os.path.basename(dest), attempts, base)
+
+
+# Files smaller than this are not worth splitting into ranges
+PARALLEL_MIN_BYTES = 8 << 20
+
+
+def _parallel_download(url: str, dest: str, chunks: int = 8) -> None:
+    """
+    Download url with `chunks` concurrent HTTP Range requests.
+    
+    Ranges are written at their offsets into a preallocated local file, which is then
+    copied to dest in one sequential pass (Volumes do not support random-offset writes).
+    Falls back to a single stream when the server does not serve byte ranges.
+    """
+    def probe():
+        head = urllib.request.Request(url, method="HEAD")
+        with urllib.request.urlopen(head, timeout=30) as response:
+            size = int(response.headers.get("Content-Length") or 0)
+            accepts_ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+        return size, accepts_ranges
+    
     try:
-        # Try driving video first, fallback to sample
-        video_url = DRIVING_VIDEO_URLS.get(camera, FALLBACK_VIDEO_URL)
-        local_path = f"/tmp/{camera}_driving.mp4"
-        output_path = f"{OUTPUT_BASE}/{camera}_driving.mp4"
+        size, accepts_ranges = _with_retry(probe, f"{os.path.basename(dest)} HEAD")
+    except OSError as e:
+        # Some servers reject HEAD outright; the retried single stream still gets this URL
+        print(f"   ⚠️ {os.path.basename(dest)}: HEAD failed ({e}), downloading as a single stream...")
+        _download_with_retry(url, dest)
+        return
+    
+    if not accepts_ranges or size < PARALLEL_MIN_BYTES:
+        _download_with_retry(url, dest)
+        return
+    
+    local_path = f"/tmp/{os.path.basename(dest)}.part"
+    step = -(-size // chunks)  # ceil division
+    fd = os.open(local_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+    
+    def fetch_range(start: int) -> None:
+        end = min(start + step, size) - 1
         
-        print(f"📹 Downloading {camera} driving video...")
-        print(f"   URL: {video_url}")
+        def download():
+            request = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end}"})
+            with urllib.request.urlopen(request, timeout=30) as response:
+                if response.status != 206:
+                    raise ValueError(f"server ignored Range request (HTTP {response.status})")
+                offset = start
+                while block := response.read(1 << 20):
+                    os.pwrite(fd, block, offset)
+                    offset += len(block)
+            if offset != end + 1:
+                raise urllib.error.ContentTooShortError(
+                    f"range {start}-{end} incomplete at byte {offset}", None
+                )
         
+        _with_retry(download, f"{os.path.basename(dest)} bytes {start}-{end}")
+    
+    try:
         try:
-            # Download to local temp
-            urllib.request.urlretrieve(video_url, local_path)
-            file_size = os.path.getsize(local_path)
-            
-            # If file is too small (< 10KB), likely failed - use fallback
-            if file_size < 10000:
-                raise Exception("File too small, using fallback")
-                
-        except Exception as download_error:
-            print(f"   ⚠️ Primary URL failed ({download_error}), trying fallback...")
-            urllib.request.urlretrieve(FALLBACK_VIDEO_URL, local_path)
-        
-        # Get file size
-        file_size = os.path.getsize(local_path)
-        
-        # Copy to Volume
-        dbutils.fs.cp(f"file:{local_path}", output_path)
-        
-        # Cleanup local file
+            os.posix_fallocate(fd, 0, size)
+            with ThreadPoolExecutor(max_workers=chunks) as executor:
+                list(executor.map(fetch_range, range(0, size, step)))
+        finally:
+            os.close(fd)
+        shutil.copyfile(local_path, dest)
+    except ValueError as e:
+        print(f"   ⚠️ {os.path.basename(dest)}: {e}, downloading as a single stream...")
+        _download_with_retry(url, dest)
+    finally:
         os.remove(local_path)
+
+
+def fetch(camera: str) -> dict:
+    """Download one camera's video straight into the Volume"""
+    # Try driving video first, fallback to sample
+    video_url = DRIVING_VIDEO_URLS.get(camera, FALLBACK_VIDEO_URL)
+    output_path = f"{OUTPUT_BASE}/{camera}_driving.mp4"
+    
+    print(f"📹 Downloading {camera} driving video... (URL: {video_url})")
+    
+    try:
+        # Parallel ranged download for large files, otherwise streamed straight to the Volume
+        _parallel_download(video_url, output_path)
+        file_size = os.path.getsize(output_path)
         
-        downloaded_files.append({
-            "camera": camera,
-            "path": output_path,
-            "size": file_size
-        })
-        
-        print(f"✅ Downloaded {camera}: {output_path} ({file_size:,} bytes)")
-        
-    except Exception as e:
-        print(f"❌ Error downloading {camera}: {e}")
+        # If file is too small (< 10KB), likely failed - use fallback
+        if file_size < 10000:
+            raise Exception("File too small, using fallback")
+            
+    except Exception as download_error:
+        print(f"   ⚠️ {camera}: primary URL failed ({download_error}), trying fallback...")
+        _download_with_retry(FALLBACK_VIDEO_URL, output_path)
+    
+    # Get file size
+    file_size = os.path.getsize(output_path)
+    
+    return {
+        "camera": camera,
+        "path": output_path,
+        "size": file_size
+    }
+
+
+# Downloads are independent and I/O-bound: run one per camera concurrently
+downloaded_files = []
+
+with ThreadPoolExecutor(max_workers=len(CAMERAS)) as executor:
+    futures = {executor.submit(fetch, camera): camera for camera in CAMERAS}
+    for future in as_completed(futures):
+        camera = futures[future]
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"❌ Error downloading {camera}: {e}")
+            continue
+        downloaded_files.append(result)
+        print(f"✅ Downloaded {camera}: {result['path']} ({result['size']:,} bytes)")
+
+# Keep camera order stable for the metadata table
+downloaded_files.sort(key=lambda f: CAMERAS.index(f["camera"]))
 
 # COMMAND ----------
 
@@ -52,6 +52,7 @@ SELECT
 FROM STREAM read_files(
   "${raw_path}/*/*/can_frames.parquet/",
   format => 'parquet',
+  -- Older files store arb_id/dlc as INT64, newer ones as INT16/INT8; both read as LONG
   schema => 'ts DOUBLE, channel STRING, arb_id LONG, dlc LONG, data BINARY'
 );
 
@@ -11,10 +11,12 @@
 # COMMAND ----------
 
 from pyspark.sql import functions as F
+from pyspark.sql.functions import pandas_udf
 from pyspark.sql.types import (
     StructType, StructField, DoubleType, StringType, 
     BooleanType, MapType, ArrayType
 )
+import pandas as pd
 import cantools
 
 # COMMAND ----------
@@ -45,6 +47,7 @@ except Exception:
 
 print(f"Configuration: catalog={catalog}, schema={schema}")
 DBC_PATH = f"/Volumes/{catalog}/{schema}/dbc/vehicle.dbc"
+DBC_LOCAL_PATH = DBC_PATH.replace("/Volumes/", "/dbfs/Volumes/")  # Resolved once, not per call
 print(f"DBC Path: {DBC_PATH}")
 
 # COMMAND ----------
@@ -54,20 +57,15 @@ print(f"DBC Path: {DBC_PATH}")
 
 # COMMAND ----------
 
-def load_dbc_file(dbc_path: str):
+def load_dbc_file(local_path: str = DBC_LOCAL_PATH):
     """Load and parse DBC file using cantools"""
-    # Read DBC content from Volume
-    local_path = dbc_path.replace("/Volumes/", "/dbfs/Volumes/")
+    # Read DBC content from Volume. Parsed once on the driver; the UDFs close over the result
     with open(local_path, "r") as f:
-        dbc_content = f.read()
-    
-    # Parse DBC
-    db = cantools.database.load_string(dbc_content, database_format="dbc")
-    return db
+        return cantools.database.load_string(f.read(), database_format="dbc")
 
 # Load DBC at module level for reuse
 try:
-    CAN_DB = load_dbc_file(DBC_PATH)
+    CAN_DB = load_dbc_file(DBC_LOCAL_PATH)
     print(f"✅ Loaded DBC file: {DBC_PATH}")
     print(f"   Messages: {[msg.name for msg in CAN_DB.messages]}")
 except Exception as e:
@@ -92,15 +90,57 @@ DECODED_SIGNAL_SCHEMA = StructType([
     StructField("steering_angle", DoubleType(), True),
 ])
 
-def create_decode_udf(dbc_path: str):
-    """Create a UDF that decodes CAN frames using the DBC file"""
+# Per-message mapping of decoded DBC signals onto the output struct
+def _map_vehicle_speed(decoded: dict, result: dict) -> None:
+    result["speed_kmh"] = decoded.get("speed_kmh")
+
+def _map_engine_data(decoded: dict, result: dict) -> None:
+    result["rpm"] = decoded.get("rpm")
+    result["throttle_pct"] = decoded.get("throttle")
+
+def _map_brake_data(decoded: dict, result: dict) -> None:
+    result["brake_pressure"] = decoded.get("pressure")
+    result["brake_active"] = bool(decoded.get("active", 0))
+
+def _map_steering_data(decoded: dict, result: dict) -> None:
+    result["steering_angle"] = decoded.get("angle")
+
+def _map_nothing(decoded: dict, result: dict) -> None:
+    pass
+
+SIGNAL_MAPPERS = {
+    "VehicleSpeed": _map_vehicle_speed,
+    "EngineData": _map_engine_data,
+    "BrakeData": _map_brake_data,
+    "SteeringData": _map_steering_data,
+}
+
+def build_dispatch(db) -> dict:
+    """Map frame_id -> (message, signal mapper), built once per DBC"""
+    if db is None:
+        return {}
+    return {
+        message.frame_id: (message, SIGNAL_MAPPERS.get(message.name, _map_nothing))
+        for message in db.messages
+    }
+
+def create_decode_udf(db):
+    """
+    Create a UDF that decodes CAN frames using the parsed DBC database.
+    
+    The database is parsed once on the driver and captured in the closure, so it
+    ships to executors with the pickled UDF (the same effect as a broadcast,
+    which serverless / shared-access compute does not offer via sparkContext).
+    Executors never read or parse the DBC file themselves.
+    """
+    dispatch = build_dispatch(db)
     
     def decode_can_frame(arb_id: int, data: bytes) -> dict:
         """
         Decode a CAN frame using cantools and DBC file.
         
         Args:
-            arb_id: CAN Arbitration ID
+            arb_id: CAN Arbitration ID (None for a null column value)
             data: Raw CAN data bytes
             
         Returns:
@@ -120,35 +160,17 @@ def create_decode_udf(dbc_path: str):
         if data is None or len(data) == 0:
             return result
         
+        # Find message and its signal mapper by arbitration ID
+        entry = dispatch.get(arb_id)
+        if entry is None:
+            return result
+        message, map_signals = entry
+        
+        result["message_name"] = message.name
+        
         try:
-            # Load DBC inside UDF (broadcast variable would be better for production)
-            local_path = dbc_path.replace("/Volumes/", "/dbfs/Volumes/")
-            with open(local_path, "r") as f:
-                dbc_content = f.read()
-            db = cantools.database.load_string(dbc_content, database_format="dbc")
-            
-            # Find message by arbitration ID
-            message = db.get_message_by_frame_id(arb_id)
-            if message is None:
-                return result
-                
-            result["message_name"] = message.name
-            
-            # Decode signals
-            decoded = message.decode(bytes(data))
-            
-            # Map decoded signals to output schema
-            if message.name == "VehicleSpeed":
-                result["speed_kmh"] = decoded.get("speed_kmh")
-            elif message.name == "EngineData":
-                result["rpm"] = decoded.get("rpm")
-                result["throttle_pct"] = decoded.get("throttle")
-            elif message.name == "BrakeData":
-                result["brake_pressure"] = decoded.get("pressure")
-                result["brake_active"] = bool(decoded.get("active", 0))
-            elif message.name == "SteeringData":
-                result["steering_angle"] = decoded.get("angle")
-                
+            # Decode signals and map them to output schema
+            map_signals(message.decode(bytes(data)), result)
             return result
             
         except Exception as e:
@@ -157,21 +179,40 @@ def create_decode_udf(dbc_path: str):
     
     return decode_can_frame
 
+def create_decode_pandas_udf(db):
+    """
+    Create a vectorized (pandas) UDF around the row decoder.
+    
+    Spark hands over Arrow batches of arb_id/data, so the JVM<->Python
+    serialization is paid per batch (~10k rows) instead of per row.
+    """
+    decode_can_frame = create_decode_udf(db)
+    columns = DECODED_SIGNAL_SCHEMA.fieldNames()
+    
+    @pandas_udf(DECODED_SIGNAL_SCHEMA)
+    def decode_can_batch(arb_ids: pd.Series, datas: pd.Series) -> pd.DataFrame:
+        # A null arb_id arrives as NaN (the column turns float); pass None so the
+        # decoder's dispatch lookup misses and the row gets the all-None struct
+        rows = [
+            decode_can_frame(int(arb_id) if pd.notna(arb_id) else None, data)
+            for arb_id, data in zip(arb_ids, datas)
+        ]
+        return pd.DataFrame.from_records(rows, columns=columns, index=arb_ids.index)
+    
+    return decode_can_batch
+
 # Create the UDF
-decode_can_udf = F.udf(
-    create_decode_udf(DBC_PATH), 
-    DECODED_SIGNAL_SCHEMA
-)
+decode_can_udf = create_decode_pandas_udf(CAN_DB)
 
 # Register UDF for SQL use
-spark.udf.register("decode_can_frame", create_decode_udf(DBC_PATH), DECODED_SIGNAL_SCHEMA)
+spark.udf.register("decode_can_frame", decode_can_udf)
 
 print("✅ Registered UDF: decode_can_frame")
 
 # COMMAND ----------
 
 # MAGIC %md
-# MAGIC ## Message Info UDF (for quality metrics)
+# MAGIC ## Message Info Lookup (for quality metrics)
 
 # COMMAND ----------
 
@@ -181,47 +222,47 @@ MESSAGE_INFO_SCHEMA = StructType([
     StructField("expected_period_ms", DoubleType(), True),
 ])
 
-def create_message_info_udf(dbc_path: str):
-    """Create a UDF that returns message info from DBC"""
+DEFAULT_PERIOD_MS = 100.0
+
+def build_message_info(db) -> dict:
+    """Resolve name and expected period for every DBC message once (arb_id -> info)"""
+    if db is None:
+        return {}
     
-    def get_message_info(arb_id: int) -> dict:
-        """Get message name and expected period from DBC"""
-        result = {
-            "message_name": None,
-            "expected_period_ms": 100.0,  # Default period
-        }
-        
+    info = {}
+    for message in db.messages:
+        entry = {"message_name": message.name, "expected_period_ms": DEFAULT_PERIOD_MS}
         try:
-            local_path = dbc_path.replace("/Volumes/", "/dbfs/Volumes/")
-            with open(local_path, "r") as f:
-                dbc_content = f.read()
-            db = cantools.database.load_string(dbc_content, database_format="dbc")
-            
-            message = db.get_message_by_frame_id(arb_id)
-            if message is None:
-                return result
-                
-            result["message_name"] = message.name
-            
             # Get cycle time from DBC attributes
             if hasattr(message, "cycle_time") and message.cycle_time:
-                result["expected_period_ms"] = float(message.cycle_time)
+                entry["expected_period_ms"] = float(message.cycle_time)
             elif "TxPeriod" in (message.dbc_specifics or {}):
-                result["expected_period_ms"] = float(message.dbc_specifics["TxPeriod"])
+                entry["expected_period_ms"] = float(message.dbc_specifics["TxPeriod"])
             else:
                 # Fallback to known periods
                 periods = {256: 20, 257: 10, 258: 20, 259: 50}
-                result["expected_period_ms"] = float(periods.get(arb_id, 100))
-                
-            return result
-            
+                entry["expected_period_ms"] = float(periods.get(message.frame_id, 100))
         except Exception:
-            return result
+            pass
+        info[message.frame_id] = entry
+    return info
+
+MESSAGE_INFO = build_message_info(CAN_DB)
+
+def create_message_info_udf(message_info: dict):
+    """Create a thin UDF over the precomputed lookup"""
+    
+    def get_message_info(arb_id: int) -> dict:
+        """Get message name and expected period from DBC"""
+        default = {"message_name": None, "expected_period_ms": DEFAULT_PERIOD_MS}
+        return dict(message_info.get(arb_id, default))
     
     return get_message_info
 
-# Register UDF for SQL use
-spark.udf.register("get_message_info", create_message_info_udf(DBC_PATH), MESSAGE_INFO_SCHEMA)
+# Register UDF for SQL use. useArrow=True (Spark 3.5+ / DBR 14.0+) keeps the
+# row-at-a-time function but moves batches over Arrow instead of per-row pickle
+get_message_info_udf = F.udf(create_message_info_udf(MESSAGE_INFO), MESSAGE_INFO_SCHEMA, useArrow=True)
+spark.udf.register("get_message_info", get_message_info_udf)
 
 print("✅ Registered UDF: get_message_info")
 
@@ -245,8 +286,8 @@ if CAN_DB is not None:
         (259, bytes([0x00, 0x2A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00])),  # SteeringData
     ]
     
+    decoder = create_decode_udf(CAN_DB)
     for arb_id, data in test_data:
-        decoder = create_decode_udf(DBC_PATH)
         result = decoder(arb_id, data)
         print(f"  ARB_ID {arb_id}: {result}")
 
@@ -83,18 +83,37 @@ tables = [
     "gold_event_history",
     "gold_vehicle_stats",
     "gold_latest_signals",
+    "silver_can_signals",
     "silver_can_quality",
     "video_metadata",
 ]
 
-for table in tables:
+from concurrent.futures import ThreadPoolExecutor
+
+def grant(sql: str):
+    """Run one GRANT, returning the error instead of raising"""
     try:
-        sql = f"GRANT SELECT ON TABLE {catalog}.{schema}.{table} TO `{sp_client_id}`"
-        print(f"Executing: {sql}")
         spark.sql(sql)
-        print(f"✅ SELECT granted on {table}")
+        return None
     except Exception as e:
-        print(f"⚠️ Could not grant SELECT on {table}: {e}")
+        return e
+
+def run_grants(grants: dict, privilege: str) -> None:
+    """Run independent GRANTs concurrently (each is a metastore round-trip)"""
+    for sql in grants.values():
+        print(f"Executing: {sql}")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        errors = list(executor.map(grant, grants.values()))
+    for name, error in zip(grants, errors):
+        if error is None:
+            print(f"✅ {privilege} granted on {name}")
+        else:
+            print(f"⚠️ Could not grant {privilege} on {name}: {error}")
+
+run_grants(
+    {table: f"GRANT SELECT ON TABLE {catalog}.{schema}.{table} TO `{sp_client_id}`" for table in tables},
+    "SELECT",
+)
 
 # COMMAND ----------
 
@@ -109,14 +128,10 @@ volumes = [
     "raw",
 ]
 
-for volume in volumes:
-    try:
-        sql = f"GRANT READ VOLUME ON VOLUME {catalog}.{schema}.{volume} TO `{sp_client_id}`"
-        print(f"Executing: {sql}")
-        spark.sql(sql)
-        print(f"✅ READ VOLUME granted on {volume}")
-    except Exception as e:
-        print(f"⚠️ Could not grant READ VOLUME on {volume}: {e}")
+run_grants(
+    {volume: f"GRANT READ VOLUME ON VOLUME {catalog}.{schema}.{volume} TO `{sp_client_id}`" for volume in volumes},
+    "READ VOLUME",
+)
 
 # COMMAND ----------
 
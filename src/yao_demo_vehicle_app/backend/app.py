@@ -1,33 +1,53 @@
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 from .config import conf
-from .router import api
-from .utils import add_not_found_handler
+from .router import api, prewarm_video_cache
+from .utils import CachedStaticFiles, add_not_found_handler
 from .runtime import rt
+from .stats import stats_aggregator
+from .signal_buffer import signal_buffer
 from .logger import logger
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     try:
-        logger.info(f"Starting app with configuration:\n{conf.model_dump_json(indent=2)}")
-        logger.info(f"Database config: instance_name={conf.db.instance_name}, database_name={conf.db.database_name}, port={conf.db.port}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Starting app with configuration:\n%s", conf.model_dump_json(indent=2))
+        logger.info(
+            "Database config: instance_name=%s, database_name=%s, port=%s",
+            conf.db.instance_name, conf.db.database_name, conf.db.port,
+        )
         try:
             rt.validate_db()
             rt.initialize_models()
         except Exception as db_error:
-            logger.warning(f"Database validation skipped (demo mode): {type(db_error).__name__}: {str(db_error)}")
+            logger.warning("Database validation skipped (demo mode): %s: %s", type(db_error).__name__, db_error)
             logger.info("Running in demo mode without database connection")
         logger.info("App started successfully")
     except Exception as e:
-        logger.error(f"Failed to start app: {type(e).__name__}: {str(e)}", exc_info=True)
+        logger.error("Failed to start app: %s: %s", type(e).__name__, e, exc_info=True)
         raise
-    yield
+
+    # Keep /stats and /signals served from memory: fold new gold rows in every few seconds
+    tasks = []
+    if conf.unity.warehouse_id:
+        tasks.append(asyncio.create_task(stats_aggregator.run()))
+        tasks.append(asyncio.create_task(signal_buffer.run()))
+    # Fetch the camera videos in the background so the first /stream doesn't wait on the download
+    # (Files API and the Volume only, so it doesn't need the warehouse)
+    tasks.append(asyncio.create_task(prewarm_video_cache()))
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
 
 
 app = FastAPI(title=f"{conf.app_name}", lifespan=lifespan)
-ui = StaticFiles(directory=conf.static_assets_path, html=True)
+ui = CachedStaticFiles(directory=conf.static_assets_path, html=True)
 
 # note the order of includes and mounts!
 app.include_router(api)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from importlib import resources
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
@@ -39,7 +40,7 @@ class AppConfig(BaseSettings):
     db: DatabaseConfig = Field(default_factory=DatabaseConfig)
     unity: UnityConfig = Field(default_factory=UnityConfig)
 
-    @property
+    @cached_property
     def static_assets_path(self) -> Path:
         return Path(str(resources.files(app_slug))).joinpath("__dist__")
 
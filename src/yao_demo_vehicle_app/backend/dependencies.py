@@ -1,10 +1,46 @@
+import hashlib
 import os
+from functools import lru_cache
 from databricks.sdk import WorkspaceClient
 from fastapi import Header
 from typing import Annotated, Generator
 from sqlmodel import Session
 from .runtime import rt
 from .logger import logger
+from .utils import TTLCache
+
+# OBO clients per (host, token). Reusing a client keeps its HTTP session and
+# connection pool warm across a user's requests; the TTL lets rotated tokens age out.
+_obo_clients = TTLCache(maxsize=256, ttl=15 * 60)
+
+
+@lru_cache(maxsize=1)
+def _resolved_host() -> str:
+    """Workspace host for OBO clients, resolved once per process on first use."""
+    # Get host from environment or runtime workspace client
+    host = os.environ.get("DATABRICKS_HOST")
+    if not host:
+        try:
+            host = rt.ws.config.host
+        except Exception as e:
+            logger.warning("Failed to get host from rt.ws: %s", e)
+            # Fallback to default host for demo
+            host = "https://e2-demo-field-eng.cloud.databricks.com"
+    logger.info("Using host=%s for OBO WorkspaceClients", host)
+    return host
+
+
+def _obo_client(host: str, token: str) -> WorkspaceClient:
+    # Key on a digest so the cache does not hold raw tokens as keys
+    key = (host, hashlib.blake2b(token.encode(), digest_size=16).digest())
+    return _obo_clients.get_or_set(
+        key,
+        lambda: WorkspaceClient(
+            host=host,
+            token=token,
+            auth_type="pat",
+        ),  # set pat explicitly to avoid issues with SP client
+    )
 
 
 def get_obo_ws(
@@ -31,23 +67,7 @@ def get_obo_ws(
             "OBO token is not provided in the header X-Forwarded-Access-Token"
         )
 
-    # Get host from environment or runtime workspace client
-    host = os.environ.get("DATABRICKS_HOST")
-    if not host:
-        try:
-            host = rt.ws.config.host
-        except Exception as e:
-            logger.warning(f"Failed to get host from rt.ws: {e}")
-            # Fallback to default host for demo
-            host = "https://e2-demo-field-eng.cloud.databricks.com"
-    
-    logger.debug(f"Creating OBO WorkspaceClient with host={host}")
-    
-    return WorkspaceClient(
-        host=host,
-        token=token, 
-        auth_type="pat"
-    )  # set pat explicitly to avoid issues with SP client
+    return _obo_client(_resolved_host(), token)
 
 
 def get_session() -> Generator[Session, None, None]:
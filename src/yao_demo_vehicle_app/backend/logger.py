@@ -1,9 +1,62 @@
 import logging
 import sys
+from functools import lru_cache
 from typing import Optional
 from .._metadata import app_name
 
 
+@lru_cache(maxsize=2048)
+def _abbreviate_location(module: str, func_name: str, max_length: int = 20) -> str:
+    """
+    Abbreviate module and function name to fit within max_length.
+
+    Module/function pairs are a small, constantly repeating set, so results are memoized.
+
+    Args:
+        module: Module name (may contain dots)
+        func_name: Function name
+        max_length: Maximum length of the combined string
+
+    Returns:
+        Abbreviated location string
+    """
+    # Handle case when function is <module> (module-level code)
+    if func_name == "<module>":
+        location = module if module else "<module>"
+    # Handle case when module is not provided
+    elif not module or module == "__main__":
+        location = func_name
+    else:
+        location = f"{module}.{func_name}"
+
+    # If it fits, return as-is
+    if len(location) <= max_length:
+        return location
+
+    # Try abbreviating module parts to first letter
+    if module and module != "__main__" and func_name != "<module>":
+        parts = module.split(".")
+        abbreviated_parts = [p[0] for p in parts]
+        abbreviated_module = ".".join(abbreviated_parts)
+        location = f"{abbreviated_module}.{func_name}"
+
+        # If still too long, truncate function name
+        if len(location) > max_length:
+            available_for_func = (
+                max_length - len(abbreviated_module) - 1
+            )  # -1 for the dot
+            if available_for_func > 0:
+                location = f"{abbreviated_module}.{func_name[:available_for_func]}"
+            else:
+                # Extreme case: just use abbreviated module
+                location = abbreviated_module[:max_length]
+    else:
+        # No module, just truncate function name (or module name if func is <module>)
+        location = location[:max_length]
+
+    return location
+
+
 class CustomFormatter(logging.Formatter):
     """Custom formatter that adds function/class name and uses a pipe-separated format."""
 
@@ -17,66 +70,33 @@ class CustomFormatter(logging.Formatter):
         "RESET": "\033[0m",  # Reset
     }
 
+    # Let logging.Formatter.formatTime produce "YYYY-mm-dd HH:MM:SS.mmm" directly
+    default_time_format = "%Y-%m-%d %H:%M:%S"
+    default_msec_format = "%s.%03d"
+
     def __init__(self, use_colors: bool = True):
         super().__init__()
         self.use_colors = use_colors
-
-    def _abbreviate_location(
-        self, module: str, func_name: str, max_length: int = 20
-    ) -> str:
-        """
-        Abbreviate module and function name to fit within max_length.
-
-        Args:
-            module: Module name (may contain dots)
-            func_name: Function name
-            max_length: Maximum length of the combined string
-
-        Returns:
-            Abbreviated location string
-        """
-        # Handle case when function is <module> (module-level code)
-        if func_name == "<module>":
-            location = module if module else "<module>"
-        # Handle case when module is not provided
-        elif not module or module == "__main__":
-            location = func_name
-        else:
-            location = f"{module}.{func_name}"
-
-        # If it fits, return as-is
-        if len(location) <= max_length:
-            return location
-
-        # Try abbreviating module parts to first letter
-        if module and module != "__main__" and func_name != "<module>":
-            parts = module.split(".")
-            abbreviated_parts = [p[0] for p in parts]
-            abbreviated_module = ".".join(abbreviated_parts)
-            location = f"{abbreviated_module}.{func_name}"
-
-            # If still too long, truncate function name
-            if len(location) > max_length:
-                available_for_func = (
-                    max_length - len(abbreviated_module) - 1
-                )  # -1 for the dot
-                if available_for_func > 0:
-                    location = f"{abbreviated_module}.{func_name[:available_for_func]}"
-                else:
-                    # Extreme case: just use abbreviated module
-                    location = abbreviated_module[:max_length]
-        else:
-            # No module, just truncate function name (or module name if func is <module>)
-            location = location[:max_length]
-
-        return location
+        # Fixed per formatter: resolve once instead of on every record
+        self._colorize = use_colors and sys.stderr.isatty()
+        self._app_segment = f"{app_name:12s}"
+        self._level_segments = {
+            levelno: self._level_segment(logging.getLevelName(levelno))
+            for levelno in (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL)
+        }
+
+    def _level_segment(self, level: str) -> str:
+        """Padded (and optionally colored) level name."""
+        if self._colorize:
+            level_color = self.COLORS.get(level, self.COLORS["RESET"])
+            reset_color = self.COLORS["RESET"]
+            return f"{level_color}{level:8s}{reset_color}"
+        return f"{level:8s}"
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record with custom formatting."""
         # Get the time with milliseconds
-        timestamp = self.formatTime(record, "%Y-%m-%d %H:%M:%S")
-        # Add milliseconds
-        timestamp = f"{timestamp}.{int(record.msecs):03d}"
+        timestamp = self.formatTime(record)
 
         # Get the module name
         module = record.module
@@ -85,25 +105,19 @@ class CustomFormatter(logging.Formatter):
         func_name = record.funcName
 
         # Combine and abbreviate module and function name
-        location = self._abbreviate_location(module, func_name, max_length=20)
-
-        # Get log level
-        level = record.levelname
+        location = _abbreviate_location(module, func_name, 20)
 
-        # Apply colors if enabled
-        if self.use_colors and sys.stderr.isatty():
-            level_color = self.COLORS.get(level, self.COLORS["RESET"])
-            reset_color = self.COLORS["RESET"]
-            colored_level = f"{level_color}{level:8s}{reset_color}"
-        else:
-            colored_level = f"{level:8s}"
+        # Get log level (precomputed for the standard levels, colors applied if enabled)
+        colored_level = self._level_segments.get(record.levelno)
+        if colored_level is None:
+            colored_level = self._level_segment(record.levelname)
 
         # Format the message
         message = record.getMessage()
 
         # Create the pipe-separated format
         log_line = (
-            f"{timestamp} | {app_name:12s} | {colored_level} | "
+            f"{timestamp} | {self._app_segment} | {colored_level} | "
             f"{location:20s} | {message}"
         )
 
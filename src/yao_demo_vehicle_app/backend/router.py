@@ -1,11 +1,15 @@
 from __future__ import annotations
-from typing import Annotated, Optional
+from typing import Annotated, Any, Optional
 from datetime import datetime, timedelta
+import asyncio
 import os
 import random
 import math
+import sys
+import tempfile
+import requests
+from operator import itemgetter
 from fastapi import APIRouter, Depends, Query, HTTPException
-from fastapi.responses import FileResponse
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.service.iam import User as UserOut
 
@@ -13,7 +17,6 @@ from .models import (
     VersionOut,
     SignalDataOut,
     SignalTimeSeriesOut,
-    EventOut,
     EventListOut,
     EventType,
     VehicleStatsOut,
@@ -22,12 +25,14 @@ from .models import (
     CANQualityMetric,
     TimeRange,
     CameraType,
-    VideoMetadataOut,
     VideoListOut,
 )
 from .dependencies import get_obo_ws  # Used only for /current-user endpoint
 from .config import conf
 from .runtime import rt
+from .stats import stats_aggregator
+from .signal_buffer import signal_buffer, to_signal_records
+from .utils import LargeFileResponse, ModelJSONResponse, TTLCache, parse_timestamp, ttl_cached
 from .logger import logger
 
 api = APIRouter(prefix=conf.api_prefix)
@@ -51,6 +56,22 @@ def me(obo_ws: Annotated[WorkspaceClient, Depends(get_obo_ws)]):
 # Mock Data Generator (Fallback)
 # ============================================
 
+# One generator for all mock data, separate from the global `random` state;
+# hot loops bind its methods to locals once
+_rng = random.Random()
+
+
+def _standard_normals(n: int) -> list[float]:
+    """Draw n N(0, 1) samples in one batch (Box-Muller, two samples per pair of uniforms)"""
+    rnd = _rng.random
+    pairs = (n + 1) // 2
+    radii = [math.sqrt(-2.0 * math.log(1.0 - rnd())) for _ in range(pairs)]
+    angles = [math.tau * rnd() for _ in range(pairs)]
+    samples = [r * math.cos(a) for r, a in zip(radii, angles)]
+    samples += [r * math.sin(a) for r, a in zip(radii, angles)]
+    return samples[:n]
+
+
 def _generate_mock_signals(
     start_time: datetime,
     duration_minutes: int = 10,
@@ -59,30 +80,37 @@ def _generate_mock_signals(
     """Generate mock signal data for demo purposes"""
     signals = []
     current_speed = 60.0
-    current_rpm = 2500.0
-    current_throttle = 30.0
     current_brake = 0.0
     current_steering = 0.0
     
     num_points = int(duration_minutes * 60 * 1000 / interval_ms)
     
+    # Draw all noise up front: one batched normal stream, split per signal
+    noise = _standard_normals(4 * num_points)
+    speed_noise = noise[:num_points]
+    rpm_noise = noise[num_points:2 * num_points]
+    throttle_noise = noise[2 * num_points:3 * num_points]
+    steering_noise = noise[3 * num_points:]
+    rnd = _rng.random
+    brake_rolls = [rnd() for _ in range(num_points)]
+    
+    step = timedelta(milliseconds=interval_ms)
+    timestamp = start_time
+    
     for i in range(num_points):
-        speed_delta = random.gauss(0, 2)
-        current_speed = max(0, min(180, current_speed + speed_delta))
+        current_speed = max(0, min(180, current_speed + 2 * speed_noise[i]))
         
-        current_rpm = 800 + current_speed * 30 + random.gauss(0, 100)
-        current_throttle = max(0, min(100, 30 + random.gauss(0, 10)))
+        current_rpm = 800 + current_speed * 30 + 100 * rpm_noise[i]
+        current_throttle = max(0, min(100, 30 + 10 * throttle_noise[i]))
         
-        if random.random() < 0.05:
-            current_brake = random.uniform(20, 80)
+        if brake_rolls[i] < 0.05:
+            current_brake = _rng.uniform(20, 80)
         else:
             current_brake = max(0, current_brake - 5)
         
-        current_steering = current_steering * 0.9 + random.gauss(0, 20)
+        current_steering = current_steering * 0.9 + 20 * steering_noise[i]
         current_steering = max(-200, min(200, current_steering))
         
-        timestamp = start_time + timedelta(milliseconds=i * interval_ms)
-        
         signals.append(SignalDataOut(
             timestamp=timestamp,
             speed_kmh=round(current_speed, 2),
@@ -92,70 +120,63 @@ def _generate_mock_signals(
             brake_active=current_brake > 10,
             steering_angle=round(current_steering, 1),
         ))
+        timestamp += step
     
     return signals
 
 
+_EVENT_TYPES = list(EventType)
+# Value -> member lookup for DLT rows; unknown types fall back to hard_brake
+_EVENT_BY_STR = {e.value: e for e in EventType}
+
+
 def _generate_mock_events(
     start_time: datetime,
     duration_minutes: int = 10
-) -> list[EventOut]:
-    """Generate mock events for demo purposes"""
-    events = []
-    event_types = list(EventType)
-    
-    num_events = random.randint(3, 8)
-    
-    for i in range(num_events):
-        event_time = start_time + timedelta(
-            minutes=random.uniform(0, duration_minutes)
-        )
-        event_type = random.choice(event_types)
-        
-        events.append(EventOut(
-            id=f"evt_{i+1:03d}",
-            event_type=event_type,
-            timestamp=event_time,
-            speed_kmh=random.uniform(30, 100),
-            acceleration=random.uniform(-30, 30) if event_type != EventType.SHARP_TURN else None,
-            steering_angle=random.uniform(-300, 300) if event_type == EventType.SHARP_TURN else None,
-            brake_pressure=random.uniform(50, 100) if event_type == EventType.HARD_BRAKE else None,
-            vehicle_id="VH001",
-        ))
-    
-    return sorted(events, key=lambda e: e.timestamp)
+) -> list[dict[str, Any]]:
+    """Generate mock events for demo purposes (plain dicts shaped like EventOut, sorted by time)"""
+    num_events = _rng.randint(3, 8)
+    uniform = _rng.uniform
+    event_types = _rng.choices(_EVENT_TYPES, k=num_events)
+    offsets = [uniform(0, duration_minutes) for _ in range(num_events)]
+    
+    events = [
+        {
+            "id": f"evt_{i+1:03d}",
+            "event_type": event_type,
+            "timestamp": start_time + timedelta(minutes=offset),
+            "speed_kmh": uniform(30, 100),
+            "acceleration": uniform(-30, 30) if event_type is not EventType.SHARP_TURN else None,
+            "steering_angle": uniform(-300, 300) if event_type is EventType.SHARP_TURN else None,
+            "brake_pressure": uniform(50, 100) if event_type is EventType.HARD_BRAKE else None,
+            "vehicle_id": "VH001",
+        }
+        for i, (event_type, offset) in enumerate(zip(event_types, offsets))
+    ]
+    events.sort(key=itemgetter("timestamp"))
+    return events
 
 
 # ============================================
 # Data Fetchers from DLT Tables
 # ============================================
 
-def _fetch_signals_from_dlt(
-    time_range: TimeRange,
-    vehicle_id: str,
-    limit: int = 600
-) -> list[SignalDataOut]:
-    """Fetch signals from gold_signals_aggregated table using Service Principal
-    
-    Uses relative time filter based on MAX(timestamp) in the table, not current_timestamp().
-    This ensures we get data even if the table contains historical data.
-    """
-    logger.info(f"Fetching signals from DLT for time_range={time_range}, vehicle_id={vehicle_id}")
-    try:
-        # Time filter based on range - use MAX(timestamp) as reference instead of current_timestamp()
-        # This ensures we get data even if the table has historical data
-        if time_range == TimeRange.LAST_10_MIN:
-            time_filter = "timestamp >= (SELECT MAX(timestamp) - INTERVAL 10 MINUTES FROM gold_signals_aggregated)"
-        elif time_range == TimeRange.LAST_1_HOUR:
-            time_filter = "timestamp >= (SELECT MAX(timestamp) - INTERVAL 1 HOUR FROM gold_signals_aggregated)"
-        elif time_range == TimeRange.TODAY:
-            time_filter = "DATE(timestamp) = (SELECT DATE(MAX(timestamp)) FROM gold_signals_aggregated)"
-        elif time_range == TimeRange.LAST_24_HOURS:
-            time_filter = "timestamp >= (SELECT MAX(timestamp) - INTERVAL 24 HOURS FROM gold_signals_aggregated)"
-        else:
-            time_filter = "timestamp >= (SELECT MAX(timestamp) - INTERVAL 10 MINUTES FROM gold_signals_aggregated)"
-        
-        sql = f"""
+# Time-range windows relative to the newest row in the table (not current_timestamp()),
+# so historical demo data still shows up. :max_ts is bound per request.
+_TIME_RANGE_FILTERS: dict[TimeRange, str] = {
+    TimeRange.LAST_10_MIN: "timestamp >= CAST(:max_ts AS TIMESTAMP) - INTERVAL 10 MINUTES",
+    TimeRange.LAST_1_HOUR: "timestamp >= CAST(:max_ts AS TIMESTAMP) - INTERVAL 1 HOUR",
+    TimeRange.TODAY: "DATE(timestamp) = DATE(CAST(:max_ts AS TIMESTAMP))",
+    TimeRange.LAST_24_HOURS: "timestamp >= CAST(:max_ts AS TIMESTAMP) - INTERVAL 24 HOURS",
+}
+
+
+def _time_range_filter(time_range: TimeRange) -> str:
+    return _TIME_RANGE_FILTERS.get(time_range, _TIME_RANGE_FILTERS[TimeRange.LAST_10_MIN])
+
+
+_SIGNALS_SQL: dict[TimeRange, str] = {
+    time_range: f"""
         SELECT 
             timestamp,
             speed_kmh,
@@ -165,109 +186,111 @@ def _fetch_signals_from_dlt(
             brake_active,
             steering_angle
         FROM gold_signals_aggregated
-        WHERE {time_filter}
+        WHERE {_time_range_filter(time_range)}
         ORDER BY timestamp DESC
-        LIMIT {limit}
+        LIMIT :limit
         """
+    for time_range in TimeRange
+}
+
+_EVENTS_SQL: dict[tuple[TimeRange, bool], str] = {
+    (time_range, filter_type): f"""
+        SELECT 
+            timestamp,
+            event_type,
+            speed_kmh,
+            acceleration,
+            steering_angle,
+            brake_pressure,
+            source_file
+        FROM gold_event_history
+        WHERE {_time_range_filter(time_range)} {"AND event_type = :event_type" if filter_type else ""}
+        ORDER BY timestamp DESC
+        LIMIT :limit
+        """
+    for time_range in TimeRange
+    for filter_type in (False, True)
+}
+
+# Newest timestamp per gold table; the tables refresh every few seconds, so a short TTL is enough
+_max_timestamps = TTLCache(maxsize=8, ttl=10)
+
+
+def _table_max_timestamp(table: str) -> Optional[str]:
+    """MAX(timestamp) of a gold table, cached briefly so each request skips the extra scan"""
+    def query() -> Optional[str]:
+        rows = rt.execute_sql(f"SELECT MAX(timestamp) AS max_ts FROM {table}")
+        return rows[0].get("max_ts") if rows else None
+
+    return _max_timestamps.get_or_set(table, query)
+
+
+@ttl_cached(seconds=5)
+def _fetch_signals_from_dlt(
+    time_range: TimeRange,
+    vehicle_id: str,
+    limit: int = 600
+) -> list[dict[str, Any]]:
+    """Fetch signals from gold_signals_aggregated table using Service Principal
+    
+    Uses relative time filter based on MAX(timestamp) in the table, not current_timestamp().
+    This ensures we get data even if the table contains historical data.
+    """
+    logger.info(f"Fetching signals from DLT for time_range={time_range}, vehicle_id={vehicle_id}")
+    try:
+        max_ts = _table_max_timestamp("gold_signals_aggregated")
+        if max_ts is None:
+            return []
         
-        rows = rt.execute_sql(sql)
-        signals = []
-        
-        for row in rows:
-            # Parse timestamp
-            ts = row.get("timestamp")
-            if isinstance(ts, str):
-                ts = datetime.fromisoformat(ts.replace("Z", "+00:00").replace("+00:00", ""))
-            
-            signals.append(SignalDataOut(
-                timestamp=ts or datetime.now(),
-                speed_kmh=float(row.get("speed_kmh") or 0),
-                rpm=float(row.get("rpm") or 0),
-                throttle_pct=float(row.get("throttle_pct") or 0),
-                brake_pressure=float(row.get("brake_pressure") or 0),
-                brake_active=bool(row.get("brake_active")),
-                steering_angle=float(row.get("steering_angle") or 0),
-            ))
-        
-        # Reverse to get chronological order
-        signals.reverse()
-        return signals
+        rows = rt.execute_sql_rows(
+            _SIGNALS_SQL[time_range],
+            parameters={"max_ts": max_ts, "limit": limit},
+        )
+        # Positional rows come back newest first; the response is chronological
+        return to_signal_records(reversed(rows))
         
     except Exception as e:
         logger.warning(f"Failed to fetch signals from DLT: {e}")
         return []
 
 
+@ttl_cached(seconds=5)
 def _fetch_events_from_dlt(
     time_range: TimeRange,
     event_type: Optional[EventType] = None,
     limit: int = 50
-) -> list[EventOut]:
+) -> list[dict[str, Any]]:
     """Fetch events from gold_event_history table using Service Principal
     
+    Rows are returned as plain dicts shaped like EventOut; the model is only used for the response schema.
     Uses relative time filter based on MAX(timestamp) in the table, not current_timestamp().
     """
     try:
-        # Time filter based on range - use MAX(timestamp) as reference
-        if time_range == TimeRange.LAST_10_MIN:
-            time_filter = "timestamp >= (SELECT MAX(timestamp) - INTERVAL 10 MINUTES FROM gold_event_history)"
-        elif time_range == TimeRange.LAST_1_HOUR:
-            time_filter = "timestamp >= (SELECT MAX(timestamp) - INTERVAL 1 HOUR FROM gold_event_history)"
-        elif time_range == TimeRange.TODAY:
-            time_filter = "DATE(timestamp) = (SELECT DATE(MAX(timestamp)) FROM gold_event_history)"
-        elif time_range == TimeRange.LAST_24_HOURS:
-            time_filter = "timestamp >= (SELECT MAX(timestamp) - INTERVAL 24 HOURS FROM gold_event_history)"
-        else:
-            time_filter = "timestamp >= (SELECT MAX(timestamp) - INTERVAL 10 MINUTES FROM gold_event_history)"
+        max_ts = _table_max_timestamp("gold_event_history")
+        if max_ts is None:
+            return []
         
-        # Event type filter
-        event_filter = ""
+        parameters: dict[str, Any] = {"max_ts": max_ts, "limit": limit}
         if event_type:
-            event_filter = f"AND event_type = '{event_type.value}'"
-        
-        sql = f"""
-        SELECT 
-            timestamp,
-            event_type,
-            speed_kmh,
-            acceleration,
-            steering_angle,
-            brake_pressure,
-            source_file
-        FROM gold_event_history
-        WHERE {time_filter} {event_filter}
-        ORDER BY timestamp DESC
-        LIMIT {limit}
-        """
-        
-        rows = rt.execute_sql(sql)
-        events = []
-        
-        for i, row in enumerate(rows):
-            ts = row.get("timestamp")
-            if isinstance(ts, str):
-                ts = datetime.fromisoformat(ts.replace("Z", "+00:00").replace("+00:00", ""))
-            
-            evt_type_str = row.get("event_type", "hard_brake")
-            try:
-                evt_type = EventType(evt_type_str)
-            except ValueError:
-                evt_type = EventType.HARD_BRAKE
-            
-            accel_val = row.get("acceleration")
-            steering_val = row.get("steering_angle")
-            brake_val = row.get("brake_pressure")
-            
-            events.append(EventOut(
-                id=f"evt_{i+1:03d}",
-                event_type=evt_type,
-                timestamp=ts or datetime.now(),
-                speed_kmh=float(row.get("speed_kmh") or 0),
-                acceleration=float(accel_val) if accel_val is not None else None,
-                steering_angle=float(steering_val) if steering_val is not None else None,
-                brake_pressure=float(brake_val) if brake_val is not None else None,
-                vehicle_id="VH001",
-            ))
+            parameters["event_type"] = event_type.value
+        
+        rows = rt.execute_sql_rows(_EVENTS_SQL[(time_range, event_type is not None)], parameters=parameters)
+        now = datetime.now()
+        
+        # Positional rows in SELECT order (source_file is selected but not part of the response)
+        events = [
+            {
+                "id": f"evt_{i+1:03d}",
+                "event_type": _EVENT_BY_STR.get(evt_type, EventType.HARD_BRAKE),
+                "timestamp": parse_timestamp(ts) or now,
+                "speed_kmh": float(speed_kmh or 0),
+                "acceleration": float(accel_val) if accel_val is not None else None,
+                "steering_angle": float(steering_val) if steering_val is not None else None,
+                "brake_pressure": float(brake_val) if brake_val is not None else None,
+                "vehicle_id": "VH001",
+            }
+            for i, (ts, evt_type, speed_kmh, accel_val, steering_val, brake_val, _source_file) in enumerate(rows)
+        ]
         
         return events
         
@@ -276,94 +299,26 @@ def _fetch_events_from_dlt(
         return []
 
 
+@ttl_cached(seconds=30)
 def _fetch_stats_from_dlt(vehicle_id: str) -> Optional[VehicleStatsOut]:
-    """Fetch statistics from gold_vehicle_stats table using Service Principal"""
+    """Fetch statistics from DLT tables using Service Principal
+    
+    Runs the aggregator's first poll inline, so /stats means the same before and after the background task has warmed up.
+    """
     try:
-        sql = """
-        SELECT 
-            date,
-            source_file,
-            avg_speed_kmh,
-            max_speed_kmh,
-            avg_rpm,
-            max_rpm,
-            distance_km,
-            sample_count,
-            first_timestamp,
-            last_timestamp
-        FROM gold_vehicle_stats
-        ORDER BY date DESC
-        LIMIT 1
-        """
-        
-        rows = rt.execute_sql(sql)
-        if not rows:
-            return None
-        
-        row = rows[0]
-        
-        # Fetch event counts
-        event_sql = """
-        SELECT 
-            event_type,
-            COUNT(*) as count
-        FROM gold_event_history
-        WHERE DATE(timestamp) = current_date()
-        GROUP BY event_type
-        """
-        event_rows = rt.execute_sql(event_sql)
-        
-        hard_brake_count = 0
-        hard_accel_count = 0
-        sharp_turn_count = 0
-        
-        for er in event_rows:
-            evt_type = er.get("event_type", "")
-            count = int(er.get("count", 0))
-            if evt_type == "hard_brake":
-                hard_brake_count = count
-            elif evt_type == "hard_acceleration":
-                hard_accel_count = count
-            elif evt_type == "sharp_turn":
-                sharp_turn_count = count
-        
-        # Parse date
-        date_val = row.get("date")
-        if isinstance(date_val, str):
-            date_val = datetime.fromisoformat(date_val)
-        
-        # Calculate driving duration
-        first_ts = row.get("first_timestamp")
-        last_ts = row.get("last_timestamp")
-        duration_minutes = 0.0
-        if first_ts and last_ts:
-            if isinstance(first_ts, str):
-                first_ts = datetime.fromisoformat(first_ts.replace("Z", "+00:00").replace("+00:00", ""))
-            if isinstance(last_ts, str):
-                last_ts = datetime.fromisoformat(last_ts.replace("Z", "+00:00").replace("+00:00", ""))
-            if isinstance(first_ts, datetime) and isinstance(last_ts, datetime):
-                duration_minutes = (last_ts - first_ts).total_seconds() / 60
-        
-        return VehicleStatsOut(
-            vehicle_id=vehicle_id,
-            date=date_val or datetime.now(),
-            avg_speed_kmh=float(row.get("avg_speed_kmh") or 0),
-            max_speed_kmh=float(row.get("max_speed_kmh") or 0),
-            avg_rpm=float(row.get("avg_rpm") or 0),
-            max_rpm=float(row.get("max_rpm") or 0),
-            distance_km=float(row.get("distance_km") or 0),
-            total_events=hard_brake_count + hard_accel_count + sharp_turn_count,
-            hard_brake_count=hard_brake_count,
-            hard_acceleration_count=hard_accel_count,
-            sharp_turn_count=sharp_turn_count,
-            driving_duration_minutes=round(duration_minutes, 1),
-        )
-        
+        stats_aggregator.poll()
     except Exception as e:
         logger.warning(f"Failed to fetch stats from DLT: {e}")
         return None
+    return stats_aggregator.snapshot(vehicle_id)
 
 
+def _current_stats(vehicle_id: str) -> Optional[VehicleStatsOut]:
+    """Stats from the in-memory aggregate, or straight from DLT until it has data (cold start)"""
+    return stats_aggregator.snapshot(vehicle_id) or _fetch_stats_from_dlt(vehicle_id)
+
+
+@ttl_cached(seconds=2)
 def _fetch_latest_signal_from_dlt(vehicle_id: str) -> Optional[SignalDataOut]:
     """Fetch latest signal from gold_latest_signals table using Service Principal"""
     try:
@@ -387,8 +342,7 @@ def _fetch_latest_signal_from_dlt(vehicle_id: str) -> Optional[SignalDataOut]:
         
         row = rows[0]
         ts = row.get("timestamp")
-        if isinstance(ts, str):
-            ts = datetime.fromisoformat(ts.replace("Z", "+00:00").replace("+00:00", ""))
+        ts = parse_timestamp(ts)
         
         return SignalDataOut(
             timestamp=ts or datetime.now(),
@@ -405,6 +359,7 @@ def _fetch_latest_signal_from_dlt(vehicle_id: str) -> Optional[SignalDataOut]:
         return None
 
 
+@ttl_cached(seconds=10)
 def _fetch_quality_from_dlt(vehicle_id: str) -> Optional[CANQualityOut]:
     """Fetch quality metrics from silver_can_quality table using Service Principal"""
     try:
@@ -424,44 +379,32 @@ def _fetch_quality_from_dlt(vehicle_id: str) -> Optional[CANQualityOut]:
         ORDER BY window_end DESC, arb_id
         """
         
-        rows = rt.execute_sql(sql)
+        rows = rt.execute_sql_rows(sql)
         if not rows:
             return None
         
-        # Group by window
-        window_start = None
-        window_end = None
-        metrics = []
-        total_health = 0.0
-        
-        for row in rows:
-            ws_val = row.get("window_start")
-            we_val = row.get("window_end")
-            
-            if isinstance(ws_val, str):
-                ws_val = datetime.fromisoformat(ws_val.replace("Z", "+00:00").replace("+00:00", ""))
-            if isinstance(we_val, str):
-                we_val = datetime.fromisoformat(we_val.replace("Z", "+00:00").replace("+00:00", ""))
-            
-            if window_start is None:
-                window_start = ws_val
-                window_end = we_val
-            
-            missing_rate = float(row.get("missing_rate") or 0)
-            
-            metrics.append(CANQualityMetric(
-                arb_id=int(row.get("arb_id") or 0),
-                message_name=row.get("message_name") or "Unknown",
-                channel=row.get("channel") or "can0",
-                message_count=int(row.get("message_count") or 0),
-                expected_count=int(row.get("expected_count") or 0),
+        # Rows are ordered newest window first; the reported window comes from the first row.
+        # Positional rows are unpacked in SELECT order (NULLs still fall back).
+        window_start = parse_timestamp(rows[0][0])
+        window_end = parse_timestamp(rows[0][1])
+        
+        missing_rates = [float(row[7] or 0) for row in rows]
+        metrics = [
+            CANQualityMetric(
+                arb_id=int(arb_id or 0),
+                # Every window repeats the same few names; intern them so the cached result shares one copy
+                message_name=sys.intern(message_name or "Unknown"),
+                channel=sys.intern(channel or "can0"),
+                message_count=int(message_count or 0),
+                expected_count=int(expected_count or 0),
                 missing_rate=round(missing_rate, 4),
-                period_ms=int(row.get("expected_period_ms") or 0),
-            ))
-            
-            total_health += (1 - missing_rate)
+                period_ms=int(expected_period_ms or 0),
+            )
+            for (_, _, arb_id, message_name, channel, message_count, expected_count, _, expected_period_ms), missing_rate
+            in zip(rows, missing_rates)
+        ]
         
-        overall_health = total_health / len(metrics) if metrics else 1.0
+        overall_health = 1 - sum(missing_rates) / len(missing_rates)
         
         return CANQualityOut(
             window_start=window_start or datetime.now() - timedelta(minutes=1),
@@ -494,10 +437,13 @@ async def get_signals(
     # Try to fetch from DLT
     if conf.unity.warehouse_id:
         try:
-            signals = _fetch_signals_from_dlt(time_range, vehicle_id)
+            # Served from the in-memory window once the background poller has data
+            signals = signal_buffer.latest(time_range)
+            if signals is None:
+                signals = await asyncio.to_thread(_fetch_signals_from_dlt, time_range, vehicle_id)
             if signals:
                 logger.info(f"Fetched {len(signals)} signals from DLT")
-                return SignalTimeSeriesOut(signals=signals, count=len(signals))
+                return ModelJSONResponse({"signals": signals, "count": len(signals)})
         except Exception as e:
             logger.error(f"Error fetching signals from DLT: {type(e).__name__}: {e}", exc_info=True)
             # Fall through to mock data
@@ -518,10 +464,10 @@ async def get_signals(
     start_time = now - timedelta(minutes=duration)
     signals = _generate_mock_signals(start_time, duration)
     
-    return SignalTimeSeriesOut(
+    return ModelJSONResponse(SignalTimeSeriesOut(
         signals=signals,
         count=len(signals)
-    )
+    ))
 
 
 @api.get(
@@ -535,14 +481,14 @@ async def get_latest_signal(
     """Get the latest signal values using Service Principal"""
     # Try to fetch from DLT
     if conf.unity.warehouse_id:
-        signal = _fetch_latest_signal_from_dlt(vehicle_id)
+        signal = await asyncio.to_thread(_fetch_latest_signal_from_dlt, vehicle_id)
         if signal:
-            return signal
+            return ModelJSONResponse(signal)
     
     # Fallback to mock data
     now = datetime.now()
     signals = _generate_mock_signals(now - timedelta(seconds=1), duration_minutes=1, interval_ms=1000)
-    return signals[-1] if signals else SignalDataOut(timestamp=now)
+    return ModelJSONResponse(signals[-1] if signals else SignalDataOut(timestamp=now))
 
 
 # ============================================
@@ -563,9 +509,9 @@ async def get_events(
     """Get driving events from DLT tables using Service Principal"""
     # Try to fetch from DLT
     if conf.unity.warehouse_id:
-        events = _fetch_events_from_dlt(time_range, event_type, limit)
+        events = await asyncio.to_thread(_fetch_events_from_dlt, time_range, event_type, limit)
         if events:
-            return EventListOut(events=events, total=len(events))
+            return ModelJSONResponse({"events": events, "total": len(events)})
     
     # Fallback to mock data
     logger.info("Using mock data for events")
@@ -582,12 +528,9 @@ async def get_events(
     events = _generate_mock_events(start_time, duration)
     
     if event_type:
-        events = [e for e in events if e.event_type == event_type]
+        events = [e for e in events if e["event_type"] is event_type]
     
-    return EventListOut(
-        events=events[:limit],
-        total=len(events)
-    )
+    return ModelJSONResponse({"events": events[:limit], "total": len(events)})
 
 
 # ============================================
@@ -604,29 +547,29 @@ async def get_stats(
     vehicle_id: str = Query(default="VH001"),
 ):
     """Get vehicle statistics from DLT tables using Service Principal"""
-    # Try to fetch from DLT
+    # Try the in-memory aggregate first, then DLT directly (cold start)
     if conf.unity.warehouse_id:
-        stats = _fetch_stats_from_dlt(vehicle_id)
+        stats = await asyncio.to_thread(_current_stats, vehicle_id)
         if stats:
-            return stats
+            return ModelJSONResponse(stats)
     
     # Fallback to mock data
     now = datetime.now()
     
-    return VehicleStatsOut(
+    return ModelJSONResponse(VehicleStatsOut(
         vehicle_id=vehicle_id,
         date=now,
-        avg_speed_kmh=round(random.uniform(40, 70), 1),
-        max_speed_kmh=round(random.uniform(100, 140), 1),
-        avg_rpm=round(random.uniform(2000, 3500), 0),
-        max_rpm=round(random.uniform(5000, 6500), 0),
-        distance_km=round(random.uniform(50, 200), 1),
-        total_events=random.randint(5, 15),
-        hard_brake_count=random.randint(1, 5),
-        hard_acceleration_count=random.randint(1, 4),
-        sharp_turn_count=random.randint(1, 3),
-        driving_duration_minutes=round(random.uniform(60, 180), 0),
-    )
+        avg_speed_kmh=_rng.uniform(40, 70),
+        max_speed_kmh=_rng.uniform(100, 140),
+        avg_rpm=round(_rng.uniform(2000, 3500), 0),
+        max_rpm=round(_rng.uniform(5000, 6500), 0),
+        distance_km=_rng.uniform(50, 200),
+        total_events=_rng.randint(5, 15),
+        hard_brake_count=_rng.randint(1, 5),
+        hard_acceleration_count=_rng.randint(1, 4),
+        sharp_turn_count=_rng.randint(1, 3),
+        driving_duration_minutes=round(_rng.uniform(60, 180), 0),
+    ))
 
 
 @api.get(
@@ -640,11 +583,14 @@ async def get_stats_summary(
     """Get summary statistics for dashboard cards using Service Principal"""
     # Try to fetch latest signal and stats from DLT
     if conf.unity.warehouse_id:
-        latest = _fetch_latest_signal_from_dlt(vehicle_id)
-        stats = _fetch_stats_from_dlt(vehicle_id)
+        # Independent round trips: run both off the event loop and overlap them
+        latest, stats = await asyncio.gather(
+            asyncio.to_thread(_fetch_latest_signal_from_dlt, vehicle_id),
+            asyncio.to_thread(_current_stats, vehicle_id),
+        )
         
         if latest:
-            return VehicleStatsSummaryOut(
+            return ModelJSONResponse(VehicleStatsSummaryOut(
                 current_speed_kmh=latest.speed_kmh or 0,
                 current_rpm=latest.rpm or 0,
                 current_throttle_pct=latest.throttle_pct or 0,
@@ -654,22 +600,22 @@ async def get_stats_summary(
                 max_speed_kmh=stats.max_speed_kmh if stats else 0,
                 total_events=stats.total_events if stats else 0,
                 distance_km=stats.distance_km if stats else 0,
-            )
+            ))
     
     # Fallback to mock data
     base_speed = 65 + math.sin(datetime.now().timestamp() / 10) * 20
     
-    return VehicleStatsSummaryOut(
-        current_speed_kmh=round(max(0, base_speed + random.gauss(0, 5)), 1),
-        current_rpm=round(800 + base_speed * 30 + random.gauss(0, 200), 0),
-        current_throttle_pct=round(random.uniform(20, 50), 1),
-        current_brake_pressure=round(random.uniform(0, 20), 1),
-        current_steering_angle=round(random.gauss(0, 30), 1),
-        avg_speed_kmh=round(random.uniform(45, 65), 1),
-        max_speed_kmh=round(random.uniform(100, 130), 1),
-        total_events=random.randint(3, 12),
-        distance_km=round(random.uniform(30, 150), 1),
-    )
+    return ModelJSONResponse(VehicleStatsSummaryOut(
+        current_speed_kmh=max(0, base_speed + _rng.gauss(0, 5)),
+        current_rpm=round(800 + base_speed * 30 + _rng.gauss(0, 200), 0),
+        current_throttle_pct=_rng.uniform(20, 50),
+        current_brake_pressure=_rng.uniform(0, 20),
+        current_steering_angle=_rng.gauss(0, 30),
+        avg_speed_kmh=_rng.uniform(45, 65),
+        max_speed_kmh=_rng.uniform(100, 130),
+        total_events=_rng.randint(3, 12),
+        distance_km=_rng.uniform(30, 150),
+    ))
 
 
 # ============================================
@@ -690,6 +636,12 @@ CAN_PERIODS = {
     0x103: 50,
 }
 
+# (arb_id, name, period_ms, expected messages per 1-minute window), fixed per message
+_MOCK_QUALITY_MESSAGES = [
+    (arb_id, name, CAN_PERIODS[arb_id], 60000 // CAN_PERIODS[arb_id])
+    for arb_id, name in CAN_MESSAGE_NAMES.items()
+]
+
 
 @api.get(
     "/quality",
@@ -702,94 +654,86 @@ async def get_quality(
     """Get CAN communication quality metrics from DLT tables using Service Principal"""
     # Try to fetch from DLT
     if conf.unity.warehouse_id:
-        quality = _fetch_quality_from_dlt(vehicle_id)
+        quality = await asyncio.to_thread(_fetch_quality_from_dlt, vehicle_id)
         if quality:
-            return quality
+            return ModelJSONResponse(quality)
     
     # Fallback to mock data
     now = datetime.now()
     window_start = now - timedelta(minutes=1)
     
-    metrics = []
-    total_health = 0.0
+    missing_rates = [_rng.uniform(0, 0.05) for _ in _MOCK_QUALITY_MESSAGES]
     
-    for arb_id, name in CAN_MESSAGE_NAMES.items():
-        period_ms = CAN_PERIODS[arb_id]
-        expected_count = int(60000 / period_ms)
-        
-        missing_rate = random.uniform(0, 0.05)
-        actual_count = int(expected_count * (1 - missing_rate))
-        
-        metrics.append(CANQualityMetric(
+    metrics = [
+        CANQualityMetric(
             arb_id=arb_id,
             message_name=name,
             channel="can0",
-            message_count=actual_count,
+            message_count=int(expected_count * (1 - missing_rate)),
             expected_count=expected_count,
-            missing_rate=round(missing_rate, 4),
+            missing_rate=missing_rate,
             period_ms=period_ms,
-        ))
-        
-        total_health += (1 - missing_rate)
+        )
+        for (arb_id, name, period_ms, expected_count), missing_rate in zip(_MOCK_QUALITY_MESSAGES, missing_rates)
+    ]
     
-    overall_health = total_health / len(metrics) if metrics else 1.0
+    overall_health = 1 - sum(missing_rates) / len(missing_rates) if missing_rates else 1.0
     
-    return CANQualityOut(
+    return ModelJSONResponse(CANQualityOut(
         window_start=window_start,
         window_end=now,
         metrics=metrics,
-        overall_health=round(overall_health, 4),
-    )
+        overall_health=overall_health,
+    ))
 
 
 # ============================================
 # Video Streaming
 # ============================================
 
+# Value -> member lookup for DLT rows; unknown cameras fall back to front
+_CAMERA_BY_VALUE = {c.value: c for c in CameraType}
+
+# Keyed by whether a camera filter is applied; values are bound as parameters, so the
+# statement text stays identical across vehicles/cameras (and is safe from injection)
+_VIDEO_METADATA_SQL: dict[bool, str] = {
+    filter_camera: f"""
+        SELECT video_id, camera, vehicle_id, start_time, end_time, file_path, file_size_bytes
+        FROM video_metadata
+        WHERE vehicle_id = :vehicle_id {"AND camera = :camera" if filter_camera else ""}
+        ORDER BY start_time DESC
+        """
+    for filter_camera in (False, True)
+}
+
+
+# Video metadata only changes when new recordings land, so a longer TTL is fine
+@ttl_cached(seconds=60, maxsize=1024)
 def _fetch_video_metadata_from_dlt(
     vehicle_id: str,
     camera: Optional[CameraType] = None,
-) -> list[VideoMetadataOut]:
-    """Fetch video metadata from video_metadata table using Service Principal"""
+) -> list[dict[str, Any]]:
+    """Fetch video metadata from video_metadata table using Service Principal (plain dicts shaped like VideoMetadataOut)"""
     try:
-        camera_filter = ""
+        parameters: dict[str, Any] = {"vehicle_id": vehicle_id}
         if camera:
-            camera_filter = f"AND camera = '{camera.value}'"
+            parameters["camera"] = camera.value
         
-        sql = f"""
-        SELECT video_id, camera, vehicle_id, start_time, end_time, file_path, file_size_bytes
-        FROM video_metadata
-        WHERE vehicle_id = '{vehicle_id}' {camera_filter}
-        ORDER BY start_time DESC
-        """
-        
-        rows = rt.execute_sql(sql)
+        rows = rt.execute_sql_rows(_VIDEO_METADATA_SQL[camera is not None], parameters=parameters)
+        now = datetime.now()
         videos = []
         
-        for row in rows:
-            start_ts = row.get("start_time")
-            end_ts = row.get("end_time")
-            
-            if isinstance(start_ts, str):
-                start_ts = datetime.fromisoformat(start_ts.replace("Z", ""))
-            if isinstance(end_ts, str):
-                end_ts = datetime.fromisoformat(end_ts.replace("Z", ""))
-            
-            camera_val = row.get("camera", "front")
-            try:
-                camera_type = CameraType(camera_val)
-            except ValueError:
-                camera_type = CameraType.FRONT
-            
-            videos.append(VideoMetadataOut(
-                video_id=row.get("video_id") or "",
-                camera=camera_type,
-                vehicle_id=row.get("vehicle_id") or vehicle_id,
-                start_time=start_ts or datetime.now(),
-                end_time=end_ts or datetime.now(),
-                file_path=row.get("file_path") or "",
-                file_size_bytes=int(row.get("file_size_bytes") or 0) if row.get("file_size_bytes") else None,
-            ))
+        # Positional rows in SELECT order; parse_timestamp slices the "Z" and passes typed values through
+        for video_id, camera_val, row_vehicle_id, start_ts, end_ts, file_path, file_size_bytes in rows:
+            videos.append({
+                "video_id": video_id or "",
+                "camera": _CAMERA_BY_VALUE.get(camera_val, CameraType.FRONT),
+                "vehicle_id": row_vehicle_id or vehicle_id,
+                "start_time": parse_timestamp(start_ts) or now,
+                "end_time": parse_timestamp(end_ts) or now,
+                "file_path": file_path or "",
+                "file_size_bytes": int(file_size_bytes) if file_size_bytes else None,
+            })
         
         return videos
     except Exception as e:
@@ -797,21 +741,31 @@ def _fetch_video_metadata_from_dlt(
         return []
 
 
-def _generate_mock_video_metadata(vehicle_id: str) -> list[VideoMetadataOut]:
-    """Generate mock video metadata"""
+# Per-camera parts of the mock metadata that never change; only ids and timestamps are stamped per request
+_MOCK_VIDEO_TEMPLATES: dict[CameraType, dict[str, Any]] = {
+    camera: {
+        "file_path": f"/Volumes/{conf.unity.catalog}/{conf.unity.schema_name}/videos/{camera.value}_driving.mp4",
+        "file_size_bytes": 383631,
+    }
+    for camera in CameraType
+}
+
+
+def _generate_mock_video_metadata(vehicle_id: str) -> list[dict[str, Any]]:
+    """Generate mock video metadata (plain dicts shaped like VideoMetadataOut)"""
     now = datetime.now()
-    videos = []
-    for camera in CameraType:
-        videos.append(VideoMetadataOut(
-            video_id=f"vid_{vehicle_id}_{camera.value}",
-            camera=camera,
-            vehicle_id=vehicle_id,
-            start_time=now - timedelta(minutes=10),
-            end_time=now,
-            file_path=f"/Volumes/{conf.unity.catalog}/{conf.unity.schema_name}/videos/{camera.value}_driving.mp4",
-            file_size_bytes=383631,
-        ))
-    return videos
+    start_time = now - timedelta(minutes=10)
+    return [
+        {
+            "video_id": f"vid_{vehicle_id}_{camera.value}",
+            "camera": camera,
+            "vehicle_id": vehicle_id,
+            "start_time": start_time,
+            "end_time": now,
+            **template,
+        }
+        for camera, template in _MOCK_VIDEO_TEMPLATES.items()
+    ]
 
 
 @api.get("/videos", response_model=VideoListOut, operation_id="getVideos")
@@ -821,32 +775,61 @@ async def get_videos(
 ):
     """Get list of available videos with metadata using Service Principal"""
     if conf.unity.warehouse_id:
-        videos = _fetch_video_metadata_from_dlt(vehicle_id, camera)
+        videos = await asyncio.to_thread(_fetch_video_metadata_from_dlt, vehicle_id, camera)
         if videos:
-            return VideoListOut(videos=videos, total=len(videos))
+            return ModelJSONResponse({"videos": videos, "total": len(videos)})
     
     videos = _generate_mock_video_metadata(vehicle_id)
     if camera:
-        videos = [v for v in videos if v.camera == camera]
-    return VideoListOut(videos=videos, total=len(videos))
+        videos = [v for v in videos if v["camera"] is camera]
+    return ModelJSONResponse({"videos": videos, "total": len(videos)})
+
+
+_VIDEO_CACHE_DIR = os.path.join(tempfile.gettempdir(), "yao_demo_vehicle_app_videos")
+_VIDEO_CACHE_PATHS: dict[CameraType, str] = {
+    camera: os.path.join(_VIDEO_CACHE_DIR, f"{camera.value}_driving.mp4") for camera in CameraType
+}
 
 
 def _get_cached_video_path(camera: CameraType) -> str:
-    """Get the local cache path for a video file"""
-    import tempfile
-    cache_dir = os.path.join(tempfile.gettempdir(), "yao_demo_vehicle_app_videos")
-    os.makedirs(cache_dir, exist_ok=True)
-    return os.path.join(cache_dir, f"{camera.value}_driving.mp4")
+    """Get the local cache path for a video file (the directory is created when a download starts)"""
+    return _VIDEO_CACHE_PATHS[camera]
+
+
+# Concurrent ranged requests per video download (part size comes from the SDK config, 10 MiB by default)
+_VIDEO_DOWNLOAD_PARALLELISM = 8
+_VIDEO_DOWNLOAD_TIMEOUT_SECONDS = 30
+_VIDEO_DOWNLOAD_CHUNK_BYTES = 1 << 20
+
+
+def _download_video_single_part(ws: WorkspaceClient, volume_path: str, local_path: str) -> None:
+    """Download a Volume file with one direct Files API REST call, streamed to disk"""
+    host = ws.config.host.rstrip('/')
+    # authenticate() reuses the SDK's cached token; the pooled session reuses the connection
+    with rt.http.get(
+        f"{host}/api/2.0/fs/files{volume_path}",
+        headers=ws.config.authenticate(),
+        stream=True,
+        timeout=_VIDEO_DOWNLOAD_TIMEOUT_SECONDS,
+    ) as response:
+        response.raise_for_status()
+        # urllib3 enforces Content-Length, so a body cut short raises instead of ending early
+        with open(local_path, 'wb') as f:
+            for chunk in response.iter_content(_VIDEO_DOWNLOAD_CHUNK_BYTES):
+                f.write(chunk)
 
 
 def _download_video_to_cache(camera: CameraType) -> str:
     """Download video from Databricks Volume to local cache"""
     local_path = _get_cached_video_path(camera)
     
-    # Check if already cached
-    if os.path.exists(local_path) and os.path.getsize(local_path) > 0:
-        logger.info(f"Video already cached at: {local_path}")
-        return local_path
+    # Check if already cached (one stat instead of exists + getsize)
+    try:
+        if os.stat(local_path).st_size > 0:
+            logger.info(f"Video already cached at: {local_path}")
+            return local_path
+    except FileNotFoundError:
+        pass
     
     catalog = conf.unity.catalog
     schema = conf.unity.schema_name
@@ -854,52 +837,107 @@ def _download_video_to_cache(camera: CameraType) -> str:
     
     logger.info(f"Downloading video from Volume: {volume_path} to {local_path}")
     
+    os.makedirs(_VIDEO_CACHE_DIR, exist_ok=True)
+    
+    # Download next to the cache entry and rename it into place once complete,
+    # so an interrupted download never looks like a cached video
+    part_path = local_path + ".part"
+    
     try:
-        import urllib.request
-        import socket
-        
-        # Use direct REST API call with shorter timeout instead of SDK
-        # The SDK has issues with Files API in Databricks Apps environment
         sp_ws = rt.ws
-        host = sp_ws.config.host.rstrip('/')
-        
-        # Get auth headers from the workspace client
-        auth_headers = sp_ws.config.authenticate()
-        
-        # Use Files API REST endpoint directly with shorter timeout
-        url = f"{host}/api/2.0/fs/files{volume_path}"
-        
-        req = urllib.request.Request(url)
-        for key, value in auth_headers.items():
-            req.add_header(key, value)
-        
-        # Set timeout to 30 seconds
-        old_timeout = socket.getdefaulttimeout()
         try:
-            socket.setdefaulttimeout(30)
-            with urllib.request.urlopen(req) as response:
-                content_bytes = response.read()
-        finally:
-            socket.setdefaulttimeout(old_timeout)
+            # Parallel ranged download (presigned URL, falling back to the Files API inside the SDK)
+            sp_ws.files.download_to(
+                volume_path,
+                part_path,
+                use_parallel=True,
+                parallelism=_VIDEO_DOWNLOAD_PARALLELISM,
+            )
+        except Exception as e:
+            # The SDK Files client has had issues in the Databricks Apps environment;
+            # fall back to a single request against the Files API REST endpoint
+            logger.warning(f"Parallel video download failed, retrying single-part: {type(e).__name__}: {e}")
+            _download_video_single_part(sp_ws, volume_path, part_path)
         
-        if not content_bytes:
+        file_size = os.path.getsize(part_path)
+        if not file_size:
             raise ValueError("Video file is empty")
         
-        # Write to local cache
-        with open(local_path, 'wb') as f:
-            f.write(content_bytes)
-        
-        logger.info(f"Video downloaded successfully: {len(content_bytes)} bytes to {local_path}")
+        # Flush the data to disk before the rename, so a crash can't leave a truncated file under the cache name
+        fd = os.open(part_path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(part_path, local_path)
+        logger.info(f"Video downloaded successfully: {file_size} bytes to {local_path}")
         return local_path
         
     except Exception as e:
         logger.error(f"Failed to download video: {type(e).__name__}: {e}", exc_info=True)
         # Clean up partial file if exists
-        if os.path.exists(local_path):
-            os.remove(local_path)
+        if os.path.exists(part_path):
+            os.remove(part_path)
         raise
 
 
+# (path, stat_result) of each camera's completed cache file. The cache directory belongs to this app
+# and files are only ever renamed into place whole, so a hit needs no filesystem calls at all.
+_video_cache_entries: dict[CameraType, tuple[str, os.stat_result]] = {}
+# One download per camera at a time; concurrent cold requests wait for it instead of racing on the same file
+_video_download_locks: dict[CameraType, asyncio.Lock] = {camera: asyncio.Lock() for camera in CameraType}
+
+
+def _cached_video(camera: CameraType) -> tuple[str, os.stat_result]:
+    """Make sure the camera's video is in the local cache and return its path and stat_result"""
+    entry = _video_cache_entries.get(camera)
+    if entry is None:
+        local_path = _download_video_to_cache(camera)
+        entry = (local_path, os.stat(local_path))
+        if entry[1].st_size:
+            _video_cache_entries[camera] = entry
+    return entry
+
+
+async def _ensure_cached_video(camera: CameraType) -> tuple[str, os.stat_result]:
+    """Run _cached_video off the event loop under the camera's download lock.
+    The worker thread can't be interrupted, so the lock stays held until it finishes even if the caller is
+    cancelled: a later request never starts a second writer on the same .part file."""
+    entry = _video_cache_entries.get(camera)
+    if entry is not None:
+        return entry
+    async with _video_download_locks[camera]:
+        # _cached_video returns straight away if a download we waited on just finished it
+        download = asyncio.ensure_future(asyncio.to_thread(_cached_video, camera))
+        try:
+            return await asyncio.shield(download)
+        except asyncio.CancelledError:
+            while not download.done():
+                try:
+                    await asyncio.wait({download})
+                except asyncio.CancelledError:
+                    pass
+            # Mark the outcome as retrieved; the next request retries a failed download itself
+            if not download.cancelled():
+                download.exception()
+            raise
+
+
+async def prewarm_video_cache(slow_seconds: float = 300) -> None:
+    """Download every camera's video into the local cache so the first /stream is served from disk.
+    Failures are logged and left to the normal on-demand download."""
+    tasks = {asyncio.ensure_future(_ensure_cached_video(camera)): camera for camera in CameraType}
+    # Report a slow prewarm but let it finish: cancelling can't stop the download threads anyway
+    _, pending = await asyncio.wait(tasks, timeout=slow_seconds)
+    if pending:
+        logger.warning(f"Video cache prewarm still running after {slow_seconds}s")
+        await asyncio.wait(pending)
+    for task, camera in tasks.items():
+        error = task.exception()
+        if error is not None:
+            logger.warning(f"Video cache prewarm failed for camera '{camera.value}': {type(error).__name__}: {error}")
+
+
 @api.get("/video/{camera}/stream", operation_id="streamVideo")
 async def stream_video(
     camera: CameraType,
@@ -907,27 +945,25 @@ async def stream_video(
 ):
     """Stream video from local cache (downloaded from Databricks Volumes)"""
     try:
-        # Download to local cache if not already cached
-        local_path = _download_video_to_cache(camera)
-        
-        if not os.path.exists(local_path):
+        # Download to local cache if not already cached (off the event loop)
+        try:
+            local_path, stat_result = await _ensure_cached_video(camera)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail=f"Video file not found for camera '{camera.value}'")
         
-        file_size = os.path.getsize(local_path)
-        logger.info(f"Streaming video from cache: {local_path} ({file_size} bytes)")
+        logger.info(f"Streaming video from cache: {local_path} ({stat_result.st_size} bytes)")
         
-        return FileResponse(
+        # FileResponse answers Range requests itself (206 + Content-Range) and sets
+        # Accept-Ranges/Content-Length, so seeking only transfers the requested bytes
+        return LargeFileResponse(
             path=local_path,
             media_type="video/mp4",
             filename=f"{camera.value}_driving.mp4",
-            headers={
-                "Accept-Ranges": "bytes",
-                "Content-Length": str(file_size),
-            }
+            stat_result=stat_result,
         )
     except HTTPException:
         raise
-    except TimeoutError as e:
+    except (TimeoutError, requests.Timeout) as e:
         logger.warning(f"Video download timed out for camera '{camera.value}': {e}")
         raise HTTPException(
             status_code=503, 
@@ -1,14 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from typing import Any
 import os
+import requests
+from requests.adapters import HTTPAdapter
 from databricks.sdk.errors import NotFound
-from databricks.sdk.service.sql import StatementState
+from databricks.sdk.service.sql import StatementParameterListItem, StatementState
 from sqlalchemy import Engine
 from .config import conf, AppConfig
 from databricks.sdk import WorkspaceClient
 from sqlmodel import SQLModel, Session, text
 from sqlalchemy import create_engine, event
 from .logger import logger
+from .utils import TTLCache
+
+# Well inside the one-hour lifetime of a generated database credential
+_db_credentials = TTLCache(maxsize=4, ttl=30 * 60)
+
+
+def _statement_parameter(name: str, value: Any) -> StatementParameterListItem:
+    """Bind a Python value to a `:name` marker: bools as BOOLEAN, ints as INT/BIGINT, everything else as STRING."""
+    # bool is an int subclass, so check it first
+    if isinstance(value, bool):
+        return StatementParameterListItem(name=name, value=str(value).lower(), type="BOOLEAN")
+    if type(value) is int:
+        # INT where it fits (Spark requires INT for LIMIT), BIGINT beyond it so large values don't overflow
+        int_type = "INT" if -(2 ** 31) <= value < 2 ** 31 else "BIGINT"
+        return StatementParameterListItem(name=name, value=str(value), type=int_type)
+    return StatementParameterListItem(name=name, value=None if value is None else str(value))
 
 
 class Runtime:
@@ -39,6 +58,16 @@ class Runtime:
         logger.info("Using default authentication (local dev mode)")
         return WorkspaceClient()
 
+    @cached_property
+    def http(self) -> requests.Session:
+        """
+        Shared HTTP session for direct workspace REST calls (e.g. Files API downloads).
+        Pooled keep-alive connections skip the TCP/TLS handshake on repeated requests.
+        """
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+        return session
+
     @cached_property
     def engine_url(self) -> str:
         instance = self.ws.database.get_database_instance(self.config.db.instance_name)
@@ -54,13 +83,18 @@ class Runtime:
         return f"{prefix}://{username}:@{host}:{port}/{database}"
 
     def _before_connect(self, dialect, conn_rec, cargs, cparams):
-        cred = self.ws.database.generate_database_credential(
-            instance_names=[self.config.db.instance_name]
+        # Database credentials are valid for an hour; reuse one for new pool connections
+        # instead of generating a fresh credential per physical connection
+        cparams["password"] = _db_credentials.get_or_set(
+            self.config.db.instance_name,
+            lambda: self.ws.database.generate_database_credential(
+                instance_names=[self.config.db.instance_name]
+            ).token,
         )
-        cparams["password"] = cred.token
 
-    @property
+    @cached_property
     def engine(self) -> Engine:
+        """One engine (and connection pool) per process, shared by every session"""
         engine = create_engine(
             self.engine_url,
             pool_recycle=45 * 60,
@@ -109,12 +143,58 @@ class Runtime:
         sql: str, 
         warehouse_id: str | None = None,
         ws: WorkspaceClient | None = None,
+        parameters: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Execute SQL statement using Databricks Statement Execution API.
         Uses the Service Principal WorkspaceClient by default.
+        `parameters` are bound to `:name` markers in the statement (bools as BOOLEAN, ints as INT/BIGINT, everything else as STRING).
         Returns list of dictionaries (rows).
         """
+        columns, data = self._execute_statement(sql, warehouse_id, ws, parameters)
+        return [dict(zip(columns, row_data)) for row_data in data]
+
+    def execute_sql_batch(
+        self,
+        statements: list[tuple[str, dict[str, Any] | None]],
+        warehouse_id: str | None = None,
+        ws: WorkspaceClient | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Execute several independent (sql, parameters) statements and return their rows in the same order.
+        The Statement Execution API takes one statement per call, so the calls are issued concurrently:
+        the batch costs about one warehouse round trip instead of one per statement.
+        """
+        if len(statements) <= 1:
+            return [self.execute_sql(sql, warehouse_id, ws, parameters) for sql, parameters in statements]
+        with ThreadPoolExecutor(max_workers=len(statements)) as pool:
+            futures = [
+                pool.submit(self.execute_sql, sql, warehouse_id, ws, parameters)
+                for sql, parameters in statements
+            ]
+            return [future.result() for future in futures]
+
+    def execute_sql_rows(
+        self,
+        sql: str,
+        warehouse_id: str | None = None,
+        ws: WorkspaceClient | None = None,
+        parameters: dict[str, Any] | None = None,
+    ) -> list[list[Any]]:
+        """
+        Like execute_sql, but returns the positional rows exactly as delivered (in SELECT column order),
+        without building a dict per row. For hot paths that unpack rows straight into their output.
+        """
+        return self._execute_statement(sql, warehouse_id, ws, parameters)[1]
+
+    def _execute_statement(
+        self,
+        sql: str,
+        warehouse_id: str | None,
+        ws: WorkspaceClient | None,
+        parameters: dict[str, Any] | None,
+    ) -> tuple[list[str], list[list[Any]]]:
+        """Run the statement and return (column names, positional rows)"""
         # Use provided ws or default to Service Principal client
         client = ws or self.ws
         
@@ -125,7 +205,7 @@ class Runtime:
         catalog = self.config.unity.catalog
         schema = self.config.unity.schema_name
         
-        logger.debug(f"Executing SQL: {sql[:200]}...")
+        logger.debug("Executing SQL: %.200s...", sql)
         
         response = client.statement_execution.execute_statement(
             warehouse_id=wh_id,
@@ -133,6 +213,9 @@ class Runtime:
             catalog=catalog,
             schema=schema,
             wait_timeout="30s",
+            parameters=[
+                _statement_parameter(name, value) for name, value in parameters.items()
+            ] if parameters else None,
         )
         
         if response.status is None:
@@ -147,18 +230,27 @@ class Runtime:
         
         # Parse results
         if not response.result or not response.result.data_array:
-            return []
+            return [], []
         
         if response.manifest is None or response.manifest.schema is None:
-            return []
+            return [], []
         
         columns = [col.name for col in response.manifest.schema.columns or []]
-        rows = []
-        for row_data in response.result.data_array:
-            row = dict(zip(columns, row_data))
-            rows.append(row)
+        data = response.result.data_array
+        
+        # Larger results are split into chunks; only chunk 0 comes back with the statement.
+        # Fetch the rest concurrently (map keeps chunk order) instead of silently dropping them.
+        total_chunks = response.manifest.total_chunk_count or 1
+        if total_chunks > 1 and response.statement_id:
+            statement_id = response.statement_id
+            with ThreadPoolExecutor(max_workers=min(8, total_chunks - 1)) as pool:
+                chunks = pool.map(
+                    lambda index: client.statement_execution.get_statement_result_chunk_n(statement_id, index),
+                    range(1, total_chunks),
+                )
+                data = data + [row for chunk in chunks for row in chunk.data_array or []]
         
-        return rows
+        return columns, data
 
 
 rt = Runtime()
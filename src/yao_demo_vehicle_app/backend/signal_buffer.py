@@ -0,0 +1,124 @@
+import asyncio
+import threading
+from bisect import bisect_left
+from collections import deque
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Iterable, Optional
+from .models import TimeRange
+from .runtime import rt
+from .logger import logger
+from .utils import parse_timestamp
+
+# 6 minutes of 100 ms gold rows; /signals never returns more than 600 of them
+_MAX_ROWS = 3600
+
+_SIGNAL_COLUMNS = """
+    timestamp,
+    speed_kmh,
+    rpm,
+    throttle_pct,
+    brake_pressure,
+    brake_active,
+    steering_angle
+"""
+
+# First poll: the newest rows in the table. Later polls: only rows newer than the last one buffered.
+# The warm query pages from the oldest new row, so a full page means more rows landed than fit in one
+# catch-up (pipeline refresh, backlog after a warehouse hiccup); poll() then re-seeds from the cold query
+# so the window jumps to the newest rows instead of trailing behind them.
+_COLD_SQL = f"SELECT {_SIGNAL_COLUMNS} FROM gold_signals_aggregated ORDER BY timestamp DESC LIMIT {_MAX_ROWS}"
+_WARM_SQL = f"""
+SELECT {_SIGNAL_COLUMNS}
+FROM gold_signals_aggregated
+WHERE timestamp > CAST(:last_seen AS TIMESTAMP)
+ORDER BY timestamp ASC
+LIMIT {_MAX_ROWS}
+"""
+
+# Same windows as the SQL time-range filters in the router, relative to the newest row
+_WINDOWS: dict[TimeRange, timedelta] = {
+    TimeRange.LAST_10_MIN: timedelta(minutes=10),
+    TimeRange.LAST_1_HOUR: timedelta(hours=1),
+    TimeRange.LAST_24_HOURS: timedelta(hours=24),
+}
+
+
+def to_signal_records(rows: Iterable[list[Any]]) -> list[dict[str, Any]]:
+    """Unpack positional gold_signals_aggregated rows (SELECT order) into /signals records"""
+    now = datetime.now()
+    return [
+        {
+            "timestamp": parse_timestamp(ts) or now,
+            "speed_kmh": float(speed_kmh or 0),
+            "rpm": float(rpm or 0),
+            "throttle_pct": float(throttle_pct or 0),
+            "brake_pressure": float(brake_pressure or 0),
+            "brake_active": bool(brake_active),
+            "steering_angle": float(steering_angle or 0),
+        }
+        for ts, speed_kmh, rpm, throttle_pct, brake_pressure, brake_active, steering_angle in rows
+    ]
+
+
+def _window_start(time_range: TimeRange, newest: datetime) -> datetime:
+    if time_range == TimeRange.TODAY:
+        return datetime(newest.year, newest.month, newest.day, tzinfo=newest.tzinfo)
+    return newest - _WINDOWS.get(time_range, _WINDOWS[TimeRange.LAST_10_MIN])
+
+
+class SignalBuffer:
+    """
+    The newest gold signal rows kept in memory as a chronological sliding window.
+    A background task appends only rows newer than the last one seen; the bounded deque drops the
+    oldest rows in bulk as new ones arrive, so /signals slices memory instead of querying the warehouse per poll.
+    """
+
+    def __init__(self, maxlen: int = _MAX_ROWS):
+        self._records: deque[dict[str, Any]] = deque(maxlen=maxlen)
+        self._last_seen: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def poll(self) -> None:
+        """Fetch rows newer than the last poll and append them to the window"""
+        reseed = self._last_seen is None
+        if not reseed:
+            rows = rt.execute_sql_rows(_WARM_SQL, parameters={"last_seen": self._last_seen})
+            # A full page may not reach the newest rows; start over from them
+            reseed = len(rows) >= _MAX_ROWS
+        if reseed:
+            rows = rt.execute_sql_rows(_COLD_SQL)
+            rows.reverse()
+        if not rows:
+            # An empty table leaves the watermark unset, so the next poll retries the cold query
+            return
+
+        records = to_signal_records(rows)
+        with self._lock:
+            if reseed:
+                self._records.clear()
+            self._records.extend(records)
+            # Keep the raw string so it binds back unchanged on the next poll
+            self._last_seen = rows[-1][0]
+
+    def latest(self, time_range: TimeRange, limit: int = 600) -> Optional[list[dict[str, Any]]]:
+        """Newest `limit` records inside the time range, oldest first; None until the first poll has data"""
+        with self._lock:
+            if not self._records:
+                return None
+            tail = list(islice(reversed(self._records), limit))
+        tail.reverse()
+        start = bisect_left(tail, _window_start(time_range, tail[-1]["timestamp"]), key=lambda r: r["timestamp"])
+        return tail[start:]
+
+    async def run(self, interval_seconds: float = 1.0) -> None:
+        """Poll forever; errors are logged and retried on the next tick"""
+        while True:
+            try:
+                await asyncio.to_thread(self.poll)
+            except Exception as e:
+                logger.warning("Signal buffer poll failed: %s: %s", type(e).__name__, e)
+            await asyncio.sleep(interval_seconds)
+
+
+signal_buffer = SignalBuffer()
@@ -0,0 +1,195 @@
+import asyncio
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Optional
+from .models import EventType, VehicleStatsOut
+from .runtime import rt
+from .logger import logger
+from .utils import parse_timestamp
+
+# Same samples and formulas as gold_vehicle_stats: one silver row per decoded frame, and the
+# VehicleSpeed message (0x100) the distance integrates over is sent every 20 ms
+_SAMPLE_SECONDS = 0.02
+
+_SIGNAL_BUCKETS_SQL = """
+SELECT
+    date_trunc('MINUTE', timestamp) AS minute,
+    SUM(speed_kmh) AS sum_speed,
+    COUNT(speed_kmh) AS speed_count,
+    MAX(speed_kmh) AS max_speed,
+    SUM(rpm) AS sum_rpm,
+    COUNT(rpm) AS rpm_count,
+    MAX(rpm) AS max_rpm,
+    MIN(timestamp) AS first_ts,
+    MAX(timestamp) AS last_ts
+FROM silver_can_signals
+WHERE {where}
+GROUP BY 1
+"""
+
+_EVENT_BUCKETS_SQL = """
+SELECT
+    date_trunc('MINUTE', timestamp) AS minute,
+    event_type,
+    COUNT(*) AS count
+FROM gold_event_history
+WHERE {where}
+GROUP BY 1, 2
+"""
+
+# First poll: the whole newest day of samples (events for that same day).
+# Later polls re-read every minute from _OVERLAP before the newest bucket and replace those buckets outright,
+# so rows that land behind the newest timestamp (a late source_file, a materialized view recompute) are
+# picked up instead of being skipped by a strict watermark, and nothing is counted twice.
+_OVERLAP = timedelta(minutes=5)
+_COLD_WHERE = "timestamp >= (SELECT date_trunc('DAY', MAX(timestamp)) FROM silver_can_signals)"
+_WARM_WHERE = "timestamp >= CAST(:since AS TIMESTAMP)"
+
+
+def _to_float(value: Any) -> float:
+    return float(value) if value is not None else 0.0
+
+
+@dataclass(slots=True)
+class _Bucket:
+    """Per-minute signal aggregates; merge() is associative, so buckets can be reduced in any order"""
+    sum_speed: float = 0.0
+    speed_count: int = 0
+    max_speed: float = 0.0
+    sum_rpm: float = 0.0
+    rpm_count: int = 0
+    max_rpm: float = 0.0
+    first_ts: Optional[datetime] = None
+    last_ts: Optional[datetime] = None
+
+    def merge(self, other: "_Bucket") -> None:
+        self.sum_speed += other.sum_speed
+        self.speed_count += other.speed_count
+        self.max_speed = max(self.max_speed, other.max_speed)
+        self.sum_rpm += other.sum_rpm
+        self.rpm_count += other.rpm_count
+        self.max_rpm = max(self.max_rpm, other.max_rpm)
+        if other.first_ts is not None and (self.first_ts is None or other.first_ts < self.first_ts):
+            self.first_ts = other.first_ts
+        if other.last_ts is not None and (self.last_ts is None or other.last_ts > self.last_ts):
+            self.last_ts = other.last_ts
+
+
+def _replace_from(buckets: dict[datetime, Any], since: Optional[datetime], updates: dict[datetime, Any]) -> None:
+    """Swap in freshly read buckets: everything from `since` on (all of it for a cold read) is replaced"""
+    if since is None:
+        buckets.clear()
+    else:
+        for minute in [m for m in buckets if m >= since]:
+            del buckets[minute]
+    buckets.update(updates)
+
+
+class StatsAggregator:
+    """
+    Daily vehicle statistics kept in memory as one bucket per minute.
+    A background task re-reads only the trailing minutes of the silver samples and event history on each poll
+    and replaces those buckets, so /stats reduces at most 1440 buckets instead of querying the warehouse on every request.
+    """
+
+    def __init__(self):
+        self._signal_buckets: dict[datetime, _Bucket] = {}
+        self._event_buckets: dict[datetime, Counter] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _since(buckets: dict[datetime, Any]) -> Optional[datetime]:
+        return max(buckets) - _OVERLAP if buckets else None
+
+    @staticmethod
+    def _statement(template: str, since: Optional[datetime]) -> tuple[str, Optional[dict[str, Any]]]:
+        if since is None:
+            return template.format(where=_COLD_WHERE), None
+        return template.format(where=_WARM_WHERE), {"since": since.isoformat(sep=" ")}
+
+    def poll(self) -> None:
+        """Re-read the trailing minutes (the whole day on the first poll) and replace their buckets"""
+        with self._lock:
+            signal_since = self._since(self._signal_buckets)
+            event_since = self._since(self._event_buckets)
+        signal_rows, event_rows = rt.execute_sql_batch([
+            self._statement(_SIGNAL_BUCKETS_SQL, signal_since),
+            self._statement(_EVENT_BUCKETS_SQL, event_since),
+        ])
+
+        signal_updates: dict[datetime, _Bucket] = {}
+        for row in signal_rows:
+            signal_updates[parse_timestamp(row["minute"])] = _Bucket(
+                sum_speed=_to_float(row.get("sum_speed")),
+                speed_count=int(row.get("speed_count") or 0),
+                max_speed=_to_float(row.get("max_speed")),
+                sum_rpm=_to_float(row.get("sum_rpm")),
+                rpm_count=int(row.get("rpm_count") or 0),
+                max_rpm=_to_float(row.get("max_rpm")),
+                first_ts=parse_timestamp(row.get("first_ts")),
+                last_ts=parse_timestamp(row.get("last_ts")),
+            )
+
+        event_updates: dict[datetime, Counter] = {}
+        for row in event_rows:
+            counts = event_updates.setdefault(parse_timestamp(row["minute"]), Counter())
+            counts[row.get("event_type") or ""] += int(row.get("count") or 0)
+
+        with self._lock:
+            _replace_from(self._signal_buckets, signal_since, signal_updates)
+            _replace_from(self._event_buckets, event_since, event_updates)
+            if self._signal_buckets:
+                # Keep only the newest day; older buckets no longer contribute to /stats.
+                # An empty table leaves no buckets, so the next poll retries the cold query.
+                newest_day = max(self._signal_buckets).date()
+                for buckets in (self._signal_buckets, self._event_buckets):
+                    for minute in [m for m in buckets if m.date() != newest_day]:
+                        del buckets[minute]
+
+    def snapshot(self, vehicle_id: str) -> Optional[VehicleStatsOut]:
+        """Reduce the current day's buckets into a stats response; None until the first poll has data"""
+        with self._lock:
+            if not self._signal_buckets:
+                return None
+            total = _Bucket()
+            for bucket in self._signal_buckets.values():
+                total.merge(bucket)
+            event_counts: Counter = sum(self._event_buckets.values(), Counter())
+            day: date = max(self._signal_buckets).date()
+
+        duration_minutes = 0.0
+        if total.first_ts and total.last_ts:
+            duration_minutes = (total.last_ts - total.first_ts).total_seconds() / 60
+
+        hard_brake_count = event_counts[EventType.HARD_BRAKE.value]
+        hard_accel_count = event_counts[EventType.HARD_ACCELERATION.value]
+        sharp_turn_count = event_counts[EventType.SHARP_TURN.value]
+
+        return VehicleStatsOut(
+            vehicle_id=vehicle_id,
+            date=datetime(day.year, day.month, day.day),
+            avg_speed_kmh=total.sum_speed / total.speed_count if total.speed_count else 0.0,
+            max_speed_kmh=total.max_speed,
+            avg_rpm=total.sum_rpm / total.rpm_count if total.rpm_count else 0.0,
+            max_rpm=total.max_rpm,
+            distance_km=total.sum_speed * _SAMPLE_SECONDS / 3600,
+            total_events=hard_brake_count + hard_accel_count + sharp_turn_count,
+            hard_brake_count=hard_brake_count,
+            hard_acceleration_count=hard_accel_count,
+            sharp_turn_count=sharp_turn_count,
+            driving_duration_minutes=round(duration_minutes, 1),
+        )
+
+    async def run(self, interval_seconds: float = 5.0) -> None:
+        """Poll forever; errors are logged and retried on the next tick"""
+        while True:
+            try:
+                await asyncio.to_thread(self.poll)
+            except Exception as e:
+                logger.warning("Stats aggregation poll failed: %s: %s", type(e).__name__, e)
+            await asyncio.sleep(interval_seconds)
+
+
+stats_aggregator = StatsAggregator()
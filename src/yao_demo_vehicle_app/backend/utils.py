@@ -1,9 +1,193 @@
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache, wraps
+from typing import Any, Callable, Hashable, TypeVar
 from fastapi import FastAPI, Request
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
+from fastapi.staticfiles import StaticFiles
+from pydantic_core import to_json
+from starlette.types import Scope
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from .config import conf
 from .logger import logger
 
+V = TypeVar("V")
+
+
+class TTLCache:
+    """
+    Small thread-safe cache whose entries expire `ttl` seconds after they are stored.
+    Once more than `maxsize` entries are held, the oldest ones are evicted first.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], V]) -> V:
+        """Return the cached value, or build it with factory() and cache it (built outside the lock)."""
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def ttl_cached(seconds: float, maxsize: int = 128) -> Callable[[Callable[..., V]], Callable[..., V]]:
+    """
+    Cache a function's results per argument tuple for `seconds`.
+    Falsy results (no rows, or a fetch that failed and returned None) are not cached, so the next call retries.
+    Concurrent misses for the same key are coalesced: one caller runs the function, the others wait for its result.
+    """
+
+    def decorator(func: Callable[..., V]) -> Callable[..., V]:
+        cache = TTLCache(maxsize, seconds)
+        key_locks: dict[Hashable, threading.Lock] = {}
+        key_locks_guard = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> V:
+            key = (args, tuple(sorted(kwargs.items())))
+            value = cache.get(key)
+            if value is not None:
+                return value
+            with key_locks_guard:
+                key_lock = key_locks.setdefault(key, threading.Lock())
+            with key_lock:
+                # Filled by whoever held the lock before us?
+                value = cache.get(key)
+                if value is None:
+                    value = func(*args, **kwargs)
+                    if value:
+                        cache.set(key, value)
+            with key_locks_guard:
+                # Drop the lock once the key is settled so arbitrary keys don't accumulate
+                if key_locks.get(key) is key_lock and not key_lock.locked():
+                    del key_locks[key]
+            return value
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+@lru_cache(maxsize=1024)
+def _parse_ts(value: str) -> datetime:
+    # A single slice for the usual trailing "Z" instead of two str.replace passes per row.
+    # Cached because quality/stats rows repeat the same window timestamps.
+    if value[-1:] == "Z":
+        return datetime.fromisoformat(value[:-1])
+    if value.endswith("+00:00"):
+        value = value[:-6]
+    return datetime.fromisoformat(value)
+
+
+def parse_timestamp(value: Any) -> Any:
+    """Parse an ISO timestamp string from the Statement Execution API into a naive (UTC) datetime.
+    The API returns every column as a string; non-string values are passed through."""
+    if isinstance(value, str):
+        return _parse_ts(value)
+    return value
+
+
+class ModelJSONResponse(JSONResponse):
+    """
+    JSONResponse that serializes straight to JSON bytes with pydantic-core.
+    Accepts pydantic models as well as plain dicts/lists (datetimes, enums and nested models included).
+    Returning it from an endpoint skips FastAPI's response_model revalidation and jsonable_encoder pass;
+    keep response_model on the route so the OpenAPI schema is unchanged.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+class LargeFileResponse(FileResponse):
+    """
+    FileResponse for large media (videos). Starlette reads the file in a worker thread per chunk,
+    so 1 MiB chunks instead of the 64 KiB default cut the thread hops and send() calls per stream.
+    Servers that offer the http.response.pathsend extension still get the path handed over directly.
+    """
+
+    chunk_size = 1 << 20
+
+
+# Largest asset kept in memory; bigger files are streamed from disk as usual.
+STATIC_CACHE_MAX_BYTES = 2 << 20
+
+
+STATIC_CACHE_MAX_ENTRIES = 128
+
+
+def _read_asset(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles that serves small assets (index.html, JS/CSS bundles) from memory.
+    Entries are keyed by (path, mtime, size), so a redeployed file is re-read on its next request.
+    Misses are read in a worker thread, like FileResponse does, so a cold bundle doesn't stall the event loop.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # LRU of (path, mtime_ns, size) -> body; only touched from the event loop, so no lock
+        self._assets: OrderedDict[tuple[str, int, int], bytes] = OrderedDict()
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await super().get_response(path, scope)
+        if (
+            not isinstance(response, FileResponse)
+            or scope["method"] != "GET"
+            or any(name == b"range" for name, _ in scope["headers"])
+        ):
+            return response
+        st = response.stat_result
+        if st is None or st.st_size > STATIC_CACHE_MAX_BYTES:
+            return response
+        key = (os.fspath(response.path), st.st_mtime_ns, st.st_size)
+        body = self._assets.get(key)
+        if body is None:
+            body = await asyncio.to_thread(_read_asset, key[0])
+            self._assets[key] = body
+            if len(self._assets) > STATIC_CACHE_MAX_ENTRIES:
+                self._assets.popitem(last=False)
+        else:
+            self._assets.move_to_end(key)
+        return Response(body, status_code=response.status_code, headers=response.headers)
+
 
 def add_not_found_handler(app: FastAPI):
     async def http_exception_handler(request: Request, exc: StarletteHTTPException):